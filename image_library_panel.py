@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Set, Tuple
 
@@ -16,7 +18,7 @@ from PyQt6.QtCore import (
     QSize,
     pyqtSignal,
 )
-from PyQt6.QtGui import QKeySequence, QShortcut, QPixmap, QPainter, QColor, QFont, QPen, QImage
+from PyQt6.QtGui import QKeySequence, QShortcut, QPixmap, QPainter, QColor, QFont, QPen, QImage, QImageReader
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QFileDialog,
@@ -55,6 +57,7 @@ THUMBNAIL_SIZE = 48
 ROW_HEIGHT = 56
 DATE_FORMAT = "yyMMdd HHmmss"
 MAX_CACHE_SIZE = 500  # Max number of cached thumbnails
+MAX_DISK_CACHE_BYTES = 100 * 1024 * 1024  # On-disk thumbnail cache ceiling
 
 
 class ThumbnailCache(QObject):
@@ -71,6 +74,8 @@ class ThumbnailCache(QObject):
         self._timer.setInterval(10)  # Process queue every 10ms
         self._timer.timeout.connect(self._process_queue)
         self._placeholder: Optional[QPixmap] = None
+        self._disk_dir: Optional[Path] = None
+        self._disk_pruned = False
     
     def get_thumbnail(self, file_path: str) -> Optional[QPixmap]:
         """Get cached thumbnail or queue for background generation."""
@@ -139,19 +144,22 @@ class ThumbnailCache(QObject):
         if cache_key in self._cache:
             return
         
-        # Load and scale the image
-        image = QImage(file_path)
-        if image.isNull():
-            return
-        
-        # Scale to thumbnail size maintaining aspect ratio
-        scaled = image.scaled(
-            THUMBNAIL_SIZE, THUMBNAIL_SIZE,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        
-        pixmap = QPixmap.fromImage(scaled)
+        # Reuse a thumbnail stored by a previous session
+        disk_path = self._disk_cache_path(file_path, mtime)
+        pixmap = QPixmap(str(disk_path)) if disk_path and disk_path.exists() else QPixmap()
+        if pixmap.isNull():
+            scaled = self._load_scaled(file_path)
+            if scaled is None:
+                return
+            pixmap = QPixmap.fromImage(scaled)
+            if disk_path:
+                self._store_on_disk(pixmap, disk_path)
+        else:
+            # Bump the file's mtime so pruning drops least-recently-used entries
+            try:
+                os.utime(disk_path)
+            except OSError:
+                pass
         
         # Evict oldest entries if cache is too large
         if len(self._cache) >= MAX_CACHE_SIZE:
@@ -163,6 +171,66 @@ class ThumbnailCache(QObject):
         self._cache[cache_key] = pixmap
         self.thumbnailReady.emit(file_path)
     
+    @staticmethod
+    def _load_scaled(file_path: str) -> Optional[QImage]:
+        """Decode near thumbnail size, then smooth-scale the remainder."""
+        reader = QImageReader(file_path)
+        size = reader.size()
+        if size.isValid() and (size.width() > THUMBNAIL_SIZE * 2 or size.height() > THUMBNAIL_SIZE * 2):
+            # Let the decoder drop most pixels; the smooth pass below finishes the job
+            reader.setScaledSize(size.scaled(
+                THUMBNAIL_SIZE * 2, THUMBNAIL_SIZE * 2, Qt.AspectRatioMode.KeepAspectRatio
+            ))
+        image = reader.read()
+        if image.isNull():
+            return None
+        
+        # Scale to thumbnail size maintaining aspect ratio
+        return image.scaled(
+            THUMBNAIL_SIZE, THUMBNAIL_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    
+    def _disk_cache_path(self, file_path: str, mtime: int) -> Optional[Path]:
+        """Return the on-disk cache file for a (path, mtime) pair."""
+        if self._disk_dir is None:
+            cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+            if not cache_root:
+                return None
+            self._disk_dir = Path(cache_root) / "CanvasForge" / "thumbnails"
+        key = f"{Path(file_path).resolve()}|{mtime}|{THUMBNAIL_SIZE}"
+        return self._disk_dir / (hashlib.sha1(key.encode()).hexdigest()[:16] + ".png")
+    
+    def _store_on_disk(self, pixmap: QPixmap, disk_path: Path) -> None:
+        """Write a thumbnail to the disk cache, pruning it once per session."""
+        try:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return
+        pixmap.save(str(disk_path), "PNG")
+        if not self._disk_pruned:
+            self._disk_pruned = True
+            self._prune_disk_cache()
+    
+    def _prune_disk_cache(self) -> None:
+        """Drop the least recently used thumbnails once the cache exceeds its ceiling."""
+        try:
+            with os.scandir(self._disk_dir) as entries:
+                files = [(entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                         for entry in entries if entry.is_file()]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= MAX_DISK_CACHE_BYTES:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+    
     def clear(self) -> None:
         """Clear the thumbnail cache."""
         self._cache.clear()
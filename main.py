@@ -2,8 +2,12 @@ import sys
 import tempfile
 import subprocess
 import os
-import time
+import stat
 import math
+import functools
+import html
+import logging
+import weakref
 
 # Force X11 backend on Wayland+NVIDIA to prevent compositor lockups
 # See: featurerequest/ProblemLog_WaylandCosmicLockup.md
@@ -16,6 +20,7 @@ if os.environ.get('XDG_SESSION_TYPE') == 'wayland':
         pass  # Fall through to default behavior
 
 from enum import Enum, auto
+from collections import namedtuple
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QGraphicsView, QGraphicsScene,
              QGraphicsPixmapItem, QListWidget,
              QToolBar, QFileDialog, QVBoxLayout, QWidget, QDockWidget,
@@ -24,18 +29,21 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QGraphicsView, QGraphics
              QDialog, QDialogButtonBox, QTabWidget, QFormLayout, QLineEdit,
              QPushButton, QHBoxLayout, QGroupBox, QFrame, QComboBox, QCheckBox,
              QToolButton, QTableWidget, QTableWidgetItem, QHeaderView, QInputDialog,
-             QMessageBox)
+             QMessageBox, QTextEdit, QStyle, QStyleOptionGraphicsItem)
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 __version__ = "1.5.0"
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
 from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 from PyQt6 import sip
 from PyQt6.QtGui import (QPixmap, QImageReader, QAction, QPainter, QIcon, QPen, QColor, QBrush,
                      QFont, QTransform, QClipboard, QImage, QKeySequence, QTextCursor, QPalette,
-                     QFontMetrics)
+                     QFontMetrics, QGuiApplication, QCursor, QSurfaceFormat)
 from PyQt6.QtCore import (Qt, QTimer, QPointF, QPoint, pyqtSignal, QRectF, QSize, QSettings, 
-                          QByteArray, QMimeData, QBuffer, QIODevice, QSizeF, QUrl)
+                          QByteArray, QMimeData, QBuffer, QIODevice, QSizeF, QUrl, QSignalBlocker, QThreadPool, QProcess,
+                          QObject)
 from pathlib import Path
 import datetime
 from image_library_panel import ImageLibraryPanel
@@ -60,6 +68,89 @@ class FillMode(Enum):
     AUTO_FILL = auto()
 
 
+log = logging.getLogger(__name__)
+
+# Max-dimension raster tiers VectorItem pre-renders; deeper zooms draw the SVG
+VECTOR_LOD_TIERS = (512, 1024, 2048)
+# QSvgRenderer -> {tier: QPixmap}, shared by every VectorItem drawing that renderer
+_vector_tier_cache = weakref.WeakKeyDictionary()
+
+# Flat per-action view of MainWindow._toolbar_action_defs for hot iteration
+ActionRow = namedtuple('ActionRow', 'is_sep is_core text icon_name action')
+
+
+class CachedSettings:
+    """
+    QSettings wrapper that memoizes reads in a dict.
+
+    Writes go straight through to QSettings (which batches disk I/O itself)
+    and invalidate the cached entry; sync() only flushes when something
+    was written. Anything not wrapped here is forwarded to QSettings.
+    """
+
+    def __init__(self, settings):
+        self._settings = settings
+        self._cache = {}  # full key -> {type: value}
+        self._groups = []
+        self._dirty = False
+
+    def _full_key(self, key):
+        return "/".join(self._groups + [key]) if self._groups else key
+
+    def value(self, key, defaultValue=None, type=None):
+        full_key = self._full_key(key)
+        by_type = self._cache.setdefault(full_key, {})
+        if type not in by_type:
+            if type is None:
+                by_type[type] = self._settings.value(full_key, defaultValue)
+            else:
+                by_type[type] = self._settings.value(full_key, defaultValue, type=type)
+        return by_type[type]
+
+    def setValue(self, key, value):
+        full_key = self._full_key(key)
+        self._settings.setValue(full_key, value)
+        self._cache.pop(full_key, None)
+        self._dirty = True
+
+    def remove(self, key):
+        full_key = self._full_key(key)
+        self._settings.remove(full_key)
+        # Removing a group drops every key underneath it
+        prefix = full_key + "/"
+        for cached_key in [k for k in self._cache if k == full_key or k.startswith(prefix)]:
+            del self._cache[cached_key]
+        self._dirty = True
+
+    def beginGroup(self, prefix):
+        # Groups are tracked here so cached keys are always fully qualified
+        self._groups.append(prefix)
+
+    def endGroup(self):
+        if self._groups:
+            self._groups.pop()
+
+    def contains(self, key):
+        return self._settings.contains(self._full_key(key))
+
+    def childKeys(self):
+        if not self._groups:
+            return self._settings.childKeys()
+        self._settings.beginGroup("/".join(self._groups))
+        try:
+            return self._settings.childKeys()
+        finally:
+            self._settings.endGroup()
+
+    def sync(self):
+        if self._dirty:
+            self._settings.sync()
+            self._dirty = False
+
+    def __getattr__(self, name):
+        return getattr(self._settings, name)
+
+
 class FlowLayout(QVBoxLayout):
     """
     A simple flow layout implementation that arranges widgets horizontally
@@ -237,6 +328,19 @@ class WrappingToolBar(QWidget):
         self._layout.rebuild(self.width())
 
 
+def _compute_scale_factor(sx, sy, cx, cy, start_length):
+    """Clamped scale for a drag from ``start_length`` to point (sx, sy) about (cx, cy)."""
+    length = math.hypot(sx - cx, sy - cy)
+    if length == 0:
+        return None
+    return max(0.1, min(10.0, length / start_length))
+
+
+def _compute_rotation_delta(sx, sy, cx, cy, start_angle):
+    """Degrees swept from ``start_angle`` to point (sx, sy) about (cx, cy)."""
+    return math.degrees(math.atan2(sy - cy, sx - cx)) - start_angle
+
+
 class ResizeHandle(QGraphicsRectItem):
     def __init__(self, handles, cursor):
         size = handles.handle_size
@@ -255,6 +359,7 @@ class ResizeHandle(QGraphicsRectItem):
         self.setBrush(QBrush(handle_color))
         self._start_center = None
         self._start_vector = None
+        self._start_length = 0.0
         self._start_scale = 1.0
 
     def cleanup(self):
@@ -270,6 +375,7 @@ class ResizeHandle(QGraphicsRectItem):
             rect = self.parent_item.boundingRect()
             self._start_center = self.parent_item.mapToScene(rect.center())
             self._start_vector = event.scenePos() - self._start_center
+            self._start_length = math.hypot(self._start_vector.x(), self._start_vector.y())
             self._start_scale = self.parent_item.scale()
             event.accept()
         else:
@@ -283,14 +389,13 @@ class ResizeHandle(QGraphicsRectItem):
                 return
             super().mouseMoveEvent(event)
             return
-        start_length = math.hypot(self._start_vector.x(), self._start_vector.y())
-        if start_length == 0:
+        if self._start_length == 0:
             return
-        current_vector = event.scenePos() - self._start_center
-        current_length = math.hypot(current_vector.x(), current_vector.y())
-        if current_length == 0:
+        pos = event.scenePos()
+        factor = _compute_scale_factor(pos.x(), pos.y(), self._start_center.x(),
+                                       self._start_center.y(), self._start_length)
+        if factor is None:
             return
-        factor = max(0.1, min(10.0, current_length / start_length))
         self.parent_item.setScale(self._start_scale * factor)
         self.handles.update_handles()
         event.accept()
@@ -327,6 +432,7 @@ class RotateHandle(QGraphicsEllipseItem):
         self.setBrush(QBrush(handle_color))
         self._start_center = None
         self._start_vector = None
+        self._start_angle = 0.0
         self._start_rotation = 0.0
 
     def cleanup(self):
@@ -338,6 +444,7 @@ class RotateHandle(QGraphicsEllipseItem):
             rect = self.parent_item.boundingRect()
             self._start_center = self.parent_item.mapToScene(rect.center())
             self._start_vector = event.scenePos() - self._start_center
+            self._start_angle = math.degrees(math.atan2(self._start_vector.y(), self._start_vector.x()))
             self._start_rotation = self.parent_item.rotation()
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
             event.accept()
@@ -348,10 +455,9 @@ class RotateHandle(QGraphicsEllipseItem):
         if self._start_vector is None:
             super().mouseMoveEvent(event)
             return
-        start_angle = math.degrees(math.atan2(self._start_vector.y(), self._start_vector.x()))
-        current_vector = event.scenePos() - self._start_center
-        current_angle = math.degrees(math.atan2(current_vector.y(), current_vector.x()))
-        delta = current_angle - start_angle
+        pos = event.scenePos()
+        delta = _compute_rotation_delta(pos.x(), pos.y(), self._start_center.x(),
+                                        self._start_center.y(), self._start_angle)
         self.parent_item.setRotation(self._start_rotation + delta)
         self.handles.update_handles()
         event.accept()
@@ -367,13 +473,26 @@ class RotateHandle(QGraphicsEllipseItem):
 class SelectionHandles:
     """Manages resize/rotate handles for a parent item."""
 
+    # Handle positions as fractions of the bounding rect: corners clockwise
+    # from top-left, then edge midpoints top, right, bottom, left
+    _UNIT_POINTS = ((0, 0), (1, 0), (1, 1), (0, 1), (0.5, 0), (1, 0.5), (0.5, 1), (0, 0.5))
+
     def __init__(self, parent):
         self.parent_item = parent
         self.handle_size = 12
         self.resize_handles = []
         self.rotate_handle = None
+        # Bounds and (scene transform, z) the handles were last placed for
+        self._cached_bounds = None
+        self._cached_transform_key = None
+        # Drags report geometry changes faster than the view repaints;
+        # coalesce them into at most one placement per frame
+        self._update_timer = QTimer()
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(8)
+        self._update_timer.timeout.connect(self._do_update_handles)
         self._create_handles()
-        self.update_handles()
+        self._do_update_handles()
 
     def _create_handles(self):
         scene = self.parent_item.scene()
@@ -389,62 +508,177 @@ class SelectionHandles:
             Qt.CursorShape.SizeVerCursor,
             Qt.CursorShape.SizeHorCursor,
         ]
+        pool = self._pool_for(scene)
         self.resize_handles = []
         for cursor in cursors:
-            handle = ResizeHandle(self, cursor)
+            handle = pool.acquire(ResizeHandle, self, cursor)
             handle.handle_index = len(self.resize_handles)
-            scene.addItem(handle)
             self.resize_handles.append(handle)
         if getattr(self.parent_item, 'supports_rotation_handles', True):
-            self.rotate_handle = RotateHandle(self)
-            scene.addItem(self.rotate_handle)
+            self.rotate_handle = pool.acquire(RotateHandle, self)
         else:
             self.rotate_handle = None
 
+    @staticmethod
+    def _pool_for(scene):
+        """Return the view's handle pool, or a throwaway one for bare scenes."""
+        for view in scene.views():
+            pool = getattr(view, 'handle_pool', None)
+            if pool is not None and pool.scene is scene:
+                return pool
+        return HandlePool(scene)
+
     def update_handles(self):
-        if not self.parent_item.scene():
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _do_update_handles(self):
+        if sip.isdeleted(self.parent_item) or not self.parent_item.scene():
             return
         rect = self.parent_item.boundingRect()
         if rect.isEmpty():
             return
-        points = [
-            rect.topLeft(),
-            rect.topRight(),
-            rect.bottomRight(),
-            rect.bottomLeft(),
-            rect.topLeft() + QPointF(rect.width() / 2, 0),
-            rect.topLeft() + QPointF(rect.width(), rect.height() / 2),
-            rect.bottomLeft() + QPointF(rect.width() / 2, 0),
-            rect.bottomLeft() + QPointF(0, -rect.height() / 2),
-        ]
-        for handle, point in zip(self.resize_handles, points):
-            scene_point = self.parent_item.mapToScene(point)
-            handle.setPos(scene_point)
-            handle.setZValue(self.parent_item.zValue() + 2)
+        transform = self.parent_item.sceneTransform()
+        z = self.parent_item.zValue() + 2
+        transform_key = (transform, z)
+        if rect == self._cached_bounds and transform_key == self._cached_transform_key:
+            return
+        self._cached_bounds = rect
+        self._cached_transform_key = transform_key
+        left, top = rect.left(), rect.top()
+        width, height = rect.width(), rect.height()
+        for handle, (u, v) in zip(self.resize_handles, self._UNIT_POINTS):
+            handle.setPos(transform.map(QPointF(left + u * width, top + v * height)))
+            handle.setZValue(z)
         if self.rotate_handle:
-            rot_point = rect.topLeft() + QPointF(rect.width() / 2, -20)
-            scene_rot = self.parent_item.mapToScene(rot_point)
-            self.rotate_handle.setPos(scene_rot)
-            self.rotate_handle.setZValue(self.parent_item.zValue() + 2)
+            self.rotate_handle.setPos(transform.map(QPointF(left + width / 2, top - 20)))
+            self.rotate_handle.setZValue(z)
 
     def cleanup(self):
+        self._update_timer.stop()
+        scene = None if sip.isdeleted(self.parent_item) else self.parent_item.scene()
+        pool = self._pool_for(scene) if scene else None
         for handle in self.resize_handles:
-            handle.cleanup()
+            if pool:
+                pool.release(handle)
+            else:
+                handle.cleanup()
         self.resize_handles.clear()
         if self.rotate_handle:
-            self.rotate_handle.cleanup()
+            if pool:
+                pool.release(self.rotate_handle)
+            else:
+                self.rotate_handle.cleanup()
             self.rotate_handle = None
 
 
+class HandlePool:
+    """Recycles resize/rotate handle items between selections.
+
+    Released handles are hidden rather than removed, so clicking through
+    items re-shows existing handles instead of adding and removing nine
+    items from the scene each time.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self._free = {ResizeHandle: [], RotateHandle: []}
+
+    def acquire(self, handle_cls, handles, *args):
+        free = self._free[handle_cls]
+        while free:
+            handle = free.pop()
+            if sip.isdeleted(handle) or handle.scene() is not self.scene:
+                continue
+            handle.handles = handles
+            handle.parent_item = handles.parent_item
+            if args:
+                handle.setCursor(args[0])
+            handle.show()
+            return handle
+        handle = handle_cls(handles, *args)
+        self.scene.addItem(handle)
+        return handle
+
+    def release(self, handle):
+        if sip.isdeleted(handle) or handle.scene() is not self.scene:
+            return
+        handle.hide()
+        handle.handles = None
+        handle.parent_item = None
+        handle._start_center = None
+        handle._start_vector = None
+        self._free[type(handle)].append(handle)
+
+
+
+# Offset applied to duplicated items so the copy is visibly distinct
+_CLONE_OFFSET = QPointF(15, 15)
+
+# Lower-case file extensions _paste_file_path accepts
+_RASTER_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp'})
+_VECTOR_EXTS = frozenset({'.svg'})
+
+
+class _PasteBatch:
+    """Items from one multi-file paste or drop, emitted together in drop order.
+
+    Raster files decode on the thread pool and finish in any order; each one
+    reserves its slot up front so the layer order follows the file order.
+    """
+    __slots__ = ('items', 'pending', 'sealed')
+
+    def __init__(self):
+        self.items = []
+        self.pending = 0
+        self.sealed = False
+
+    def reserve(self):
+        self.items.append(None)
+        self.pending += 1
+        return len(self.items) - 1
+
+
+class _ImageLoadRelay(QObject):
+    """Carries pooled image decodes back to the GUI thread; see _ImageWriteRelay."""
+    # (image, repository thumbnail, scene position, source path, paste batch
+    # or None, slot in that batch)
+    loaded = pyqtSignal(QImage, QImage, QPointF, str, object, int)
+
+
+class _ImageWriteRelay(QObject):
+    """Carries background PNG write results back to the GUI thread.
+
+    Parented to the application so it outlives the window: a write that
+    finishes after the window is gone emits into a dropped connection
+    instead of touching a deleted object.
+    """
+    # (kind, path, ok); delivered queued on the GUI thread
+    written = pyqtSignal(str, str, bool)
+
+# (tool is SELECTION, waiting for a selection region) -> view cursor
+_CURSOR_TABLE = {
+    (True, True): Qt.CursorShape.CrossCursor,
+    (True, False): Qt.CursorShape.ArrowCursor,
+    (False, False): Qt.CursorShape.ArrowCursor,
+}
+
 
 def _normalize_screen_point(screen_pos):
     """Returns a QPoint for various QPoint/QPointF-returning APIs."""
     if screen_pos is None:
         return QPoint()
-    if isinstance(screen_pos, QPoint):
+    # Exact-type checks cover what Qt events actually hand us
+    pos_type = type(screen_pos)
+    if pos_type is QPoint:
         return screen_pos
-    if hasattr(screen_pos, 'toPoint'):
+    if pos_type is QPointF:
         return screen_pos.toPoint()
+    if isinstance(screen_pos, QPoint):
+        return screen_pos
+    to_point = getattr(screen_pos, 'toPoint', None)
+    if to_point is not None:
+        return to_point()
     if hasattr(screen_pos, 'x') and hasattr(screen_pos, 'y'):
         return QPoint(int(screen_pos.x()), int(screen_pos.y()))
     return QPoint()
@@ -467,7 +701,36 @@ class ContextMenuForwarder:
         return False
 
 
-class CanvasRectItem(ContextMenuForwarder, QGraphicsRectItem):
+class CompositeInvalidator:
+    """Flags the scene's cached composite stale when an item's output changes."""
+
+    _COMPOSITE_CHANGES = frozenset({
+        QGraphicsItem.GraphicsItemChange.ItemSceneChange,
+        QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged,
+        QGraphicsItem.GraphicsItemChange.ItemRotationHasChanged,
+        QGraphicsItem.GraphicsItemChange.ItemScaleHasChanged,
+        QGraphicsItem.GraphicsItemChange.ItemTransformHasChanged,
+        QGraphicsItem.GraphicsItemChange.ItemTransformOriginPointHasChanged,
+        QGraphicsItem.GraphicsItemChange.ItemVisibleHasChanged,
+        QGraphicsItem.GraphicsItemChange.ItemOpacityHasChanged,
+        QGraphicsItem.GraphicsItemChange.ItemZValueHasChanged,
+    })
+
+    def itemChange(self, change, value):
+        if change in self._COMPOSITE_CHANGES:
+            self._mark_composite_dirty()
+            if change == QGraphicsItem.GraphicsItemChange.ItemSceneChange and value is not None:
+                # Removal only reaches the old scene, addition only the new one
+                value.setProperty("compositeDirty", True)
+        return super().itemChange(change, value)
+
+    def _mark_composite_dirty(self):
+        scene = self.scene()
+        if scene is not None:
+            scene.setProperty("compositeDirty", True)
+
+
+class CanvasRectItem(ContextMenuForwarder, CompositeInvalidator, QGraphicsRectItem):
     def __init__(self, rect):
         super().__init__(rect)
 
@@ -477,7 +740,7 @@ class CanvasRectItem(ContextMenuForwarder, QGraphicsRectItem):
         super().contextMenuEvent(event)
 
 
-class CanvasEllipseItem(ContextMenuForwarder, QGraphicsEllipseItem):
+class CanvasEllipseItem(ContextMenuForwarder, CompositeInvalidator, QGraphicsEllipseItem):
     def __init__(self, rect):
         super().__init__(rect)
 
@@ -487,16 +750,22 @@ class CanvasEllipseItem(ContextMenuForwarder, QGraphicsEllipseItem):
         super().contextMenuEvent(event)
 
 
-class CanvasTextItem(ContextMenuForwarder, QGraphicsTextItem):
+class CanvasTextItem(ContextMenuForwarder, CompositeInvalidator, QGraphicsTextItem):
+    editingStateChanged = pyqtSignal(bool)
+
     def __init__(self, text):
         super().__init__(text)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsFocusable, True)
         self._editing = False
         self.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         self.document().contentsChanged.connect(self._update_transform_origin)
+        self.document().contentsChanged.connect(self._mark_composite_dirty)
         self._update_transform_origin()
 
     def _update_transform_origin(self):
+        if self._editing:
+            # Re-centred once in leave_edit_mode rather than per keystroke
+            return
         rect = self.boundingRect()
         if rect.isEmpty():
             return
@@ -506,6 +775,7 @@ class CanvasTextItem(ContextMenuForwarder, QGraphicsTextItem):
         if self._editing:
             return
         self._editing = True
+        self.editingStateChanged.emit(True)
         self.setTextInteractionFlags(Qt.TextInteractionFlag.TextEditorInteraction)
         self.setFocus(Qt.FocusReason.MouseFocusReason)
         cursor = self.textCursor()
@@ -519,7 +789,9 @@ class CanvasTextItem(ContextMenuForwarder, QGraphicsTextItem):
         if not self._editing:
             return
         self._editing = False
+        self.editingStateChanged.emit(False)
         self.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self._update_transform_origin()
 
     def is_editing(self):
         return self._editing
@@ -620,26 +892,30 @@ class SelectionOverlay(QGraphicsRectItem):
         self._drag_start_rect = QRectF()
 
 
-class RasterItem(ContextMenuForwarder, QGraphicsPixmapItem):
+class RasterItem(ContextMenuForwarder, CompositeInvalidator, QGraphicsPixmapItem):
     def __init__(self, pixmap):
         pixmap = self._ensure_argb_pixmap(pixmap)
         super().__init__(pixmap)
+        # Repaints during pan/drag blit a device-resolution cache
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
         self.setTransformOriginPoint(pixmap.width() / 2, pixmap.height() / 2)
-        ba = QByteArray()
-        buffer = QBuffer(ba)
-        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-        pixmap.save(buffer, "PNG")
-        buffer.close()
-        self.image_bytes = bytes(ba)
+        # PNG encoding is deferred until image_bytes is actually read
+        self._image_bytes = None
+        self._image_dirty = True
         self.handles = None
         self._selection_overlay = None
         self._selection_start_scene = None
 
     @staticmethod
     def _ensure_argb_pixmap(pixmap: QPixmap) -> QPixmap:
+        # Alpha pixmaps are already ARGB32_Premultiplied, and an opaque 32-bit
+        # pixmap is RGB32, which fromImage() would hand back unchanged anyway;
+        # only other depths need the toImage() copy
+        if pixmap.hasAlphaChannel() or pixmap.depth() == 32:
+            return pixmap
         image = pixmap.toImage()
         if image.format() not in (
                 QImage.Format.Format_ARGB32,
@@ -690,8 +966,8 @@ class RasterItem(ContextMenuForwarder, QGraphicsPixmapItem):
 
     def clearSelectionOverlay(self):
         if self._selection_overlay and self._selection_overlay.scene():
-            if self._selection_overlay.isSelected():
-                self._selection_overlay.setSelected(False)
+            # removeItem() drops it from the selection and emits
+            # selectionChanged itself; deselecting first would emit twice
             self._selection_overlay.scene().removeItem(self._selection_overlay)
         self._selection_overlay = None
         self._selection_start_scene = None
@@ -716,18 +992,21 @@ class RasterItem(ContextMenuForwarder, QGraphicsPixmapItem):
             return None
 
         select_rect_int = local_rect.toAlignedRect()
-        cropped_image = self.pixmap().toImage().copy(select_rect_int)
-        cropped_image = cropped_image.convertToFormat(QImage.Format.Format_ARGB32)
-        cropped_pixmap = QPixmap.fromImage(cropped_image)
+        # RasterItem normalises its format on construction, so the crop can
+        # be copied straight off the pixmap
+        cropped_pixmap = self.pixmap().copy(select_rect_int)
 
         if remove_original:
-            base_image = self.pixmap().toImage().convertToFormat(QImage.Format.Format_ARGB32)
+            base_image = self.pixmap().toImage()
+            if not base_image.hasAlphaChannel():
+                # Opaque pixmaps come back as RGB32; clearing needs alpha
+                base_image.convertTo(QImage.Format.Format_ARGB32_Premultiplied)
             painter = QPainter(base_image)
             if fill_mode == FillMode.TRANSPARENT:
                 painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
                 painter.fillRect(select_rect_int, Qt.GlobalColor.transparent)
             elif fill_mode == FillMode.AUTO_FILL:
-                avg_color = self.pixmap().toImage().pixelColor(local_rect.center().toPoint())
+                avg_color = self._average_color(base_image, select_rect_int)
                 painter.fillRect(select_rect_int, avg_color)
             painter.end()
 
@@ -743,26 +1022,46 @@ class RasterItem(ContextMenuForwarder, QGraphicsPixmapItem):
         self.clearSelectionOverlay()
         return new_item
 
+    @staticmethod
+    def _average_color(image, rect):
+        """Mean colour of ``rect`` in ``image``."""
+        # Qt's smooth downscale box-filters the region in one native pass
+        sample = image.copy(rect).scaled(
+            1, 1,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        return sample.pixelColor(0, 0)
+
     @staticmethod
     def _scene_pos_for_center(item, center_scene_pos):
+        transform = QTransform()
+        transform.rotate(item.rotation())
+        transform.scale(item.scale(), item.scale())
         center_vec = QPointF(item.pixmap().width() / 2, item.pixmap().height() / 2)
-        scale = item.scale()
-        theta = math.radians(item.rotation())
-        cos_t = math.cos(theta)
-        sin_t = math.sin(theta)
-        rotated = QPointF(
-            (center_vec.x() * cos_t - center_vec.y() * sin_t) * scale,
-            (center_vec.x() * sin_t + center_vec.y() * cos_t) * scale,
-        )
-        return center_scene_pos - rotated
+        return center_scene_pos - transform.map(center_vec)
+
+    @property
+    def image_bytes(self):
+        """PNG encoding of the current pixmap, re-encoded only after a change."""
+        if self._image_dirty:
+            ba = QByteArray()
+            buffer = QBuffer(ba)
+            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+            self.pixmap().save(buffer, "PNG")
+            buffer.close()
+            self._image_bytes = bytes(ba)
+            self._image_dirty = False
+        return self._image_bytes
+
+    @image_bytes.setter
+    def image_bytes(self, data):
+        self._image_bytes = data
+        self._image_dirty = False
 
     def updateImageBytes(self):
-        ba = QByteArray()
-        buffer = QBuffer(ba)
-        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-        self.pixmap().save(buffer, "PNG")
-        buffer.close()
-        self.image_bytes = bytes(ba)
+        self._image_dirty = True
+        self._mark_composite_dirty()
 
     def itemChange(self, change, value):
         geometry_changes = {
@@ -792,10 +1091,24 @@ class RasterItem(ContextMenuForwarder, QGraphicsPixmapItem):
 
 
 
-class VectorItem(ContextMenuForwarder, QGraphicsSvgItem):
+class LazyRasterItem:
+    """Repository entry for an image file; decoded only when placed on the canvas."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def create_item(self):
+        pixmap = QPixmap(self.path)
+        if pixmap.isNull():
+            return None
+        return RasterItem(pixmap)
+
+
+class VectorItem(ContextMenuForwarder, CompositeInvalidator, QGraphicsSvgItem):
     def __init__(self, renderer):
         super().__init__()
         self.setSharedRenderer(renderer)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
@@ -803,6 +1116,47 @@ class VectorItem(ContextMenuForwarder, QGraphicsSvgItem):
         rect = self.boundingRect()
         self.setTransformOriginPoint(rect.width() / 2, rect.height() / 2)
         self.handles = None
+        # Tier max-dimension -> pre-rendered QPixmap; copies and re-drops of
+        # the same SVG share one set of tiers
+        self._lod_pixmaps = _vector_tier_cache.setdefault(renderer, {})
+
+    def _lod_pixmap(self, rect, required):
+        """Return the smallest cached raster tier covering `required` px, or None."""
+        for tier in VECTOR_LOD_TIERS:
+            if tier >= required:
+                break
+        else:
+            return None
+        pixmap = self._lod_pixmaps.get(tier)
+        if pixmap is None:
+            size = rect.size().scaled(tier, tier, Qt.AspectRatioMode.KeepAspectRatio).toSize()
+            pixmap = QPixmap(size)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            self.renderer.render(painter, QRectF(pixmap.rect()))
+            painter.end()
+            self._lod_pixmaps[tier] = pixmap
+        return pixmap
+
+    def paint(self, painter, option, widget=None):
+        rect = self.boundingRect()
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        required = max(rect.width(), rect.height()) * lod
+        pixmap = self._lod_pixmap(rect, required) if rect.isValid() else None
+        if pixmap is None:
+            # Zoomed past the largest tier: render the SVG itself
+            super().paint(painter, option, widget)
+            return
+        # The view skips per-item save/restore (DontSavePainterState), so
+        # keep every state change inside this bracket
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+        painter.drawPixmap(rect, pixmap, QRectF(pixmap.rect()))
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(QPen(option.palette.windowText(), 0, Qt.PenStyle.DashLine))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRect(rect)
+        painter.restore()
 
     def itemChange(self, change, value):
         geometry_changes = {
@@ -840,22 +1194,38 @@ class VectorItem(ContextMenuForwarder, QGraphicsSvgItem):
                     'height="100%" fill="red"/></svg>'
                 )
 
-        try:
-            proc = subprocess.Popen(['inkscape', temp_path])
-            while proc.poll() is None:
-                QApplication.processEvents()
-                time.sleep(0.1)
-
-            if os.path.exists(temp_path):
-                new_renderer = QSvgRenderer(temp_path)
-                if new_renderer.isValid():
-                    self.setSharedRenderer(new_renderer)
-                    self.renderer = new_renderer
-                os.unlink(temp_path)
-        except FileNotFoundError:
-            print("Inkscape not found")
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        # Run Inkscape without blocking the event loop; the SVG is reloaded
+        # once the editor exits. The process belongs to the application so
+        # deleting this item mid-edit neither kills Inkscape nor strands the
+        # temp file
+        proc = QProcess(QApplication.instance())
+        proc.setProgram('inkscape')
+        proc.setArguments([temp_path])
+        proc.finished.connect(lambda *_: self._on_inkscape_done(proc, temp_path))
+        proc.errorOccurred.connect(lambda error: self._on_inkscape_error(proc, temp_path, error))
+        proc.start()
+
+    def _on_inkscape_done(self, proc, temp_path):
+        proc.deleteLater()
+        if not os.path.exists(temp_path):
+            return
+        if not sip.isdeleted(self):
+            new_renderer = QSvgRenderer(temp_path)
+            if new_renderer.isValid():
+                self.setSharedRenderer(new_renderer)
+                self.renderer = new_renderer
+                self._mark_composite_dirty()
+                self._lod_pixmaps = _vector_tier_cache.setdefault(new_renderer, {})
+        os.unlink(temp_path)
+
+    def _on_inkscape_error(self, proc, temp_path, error):
+        # Only a failed start skips finished(); crashes still go through it
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+        print("Inkscape not found")
+        proc.deleteLater()
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
 
 
 def add_handles_support(item_class):
@@ -890,6 +1260,79 @@ add_handles_support(CanvasEllipseItem)
 add_handles_support(CanvasTextItem)
 
 
+def _clone_raster(item):
+    # QPixmap is implicitly shared and RasterItem only ever swaps in new
+    # pixmaps via setPixmap, so the clone can share pixels until one changes
+    clone = RasterItem(item.pixmap())
+    if not item._image_dirty:
+        # bytes are immutable; reuse the encoded PNG instead of re-encoding
+        clone.image_bytes = item._image_bytes
+    return clone
+
+
+def _clone_vector(item):
+    return VectorItem(item.renderer)
+
+
+def _clone_rect(item):
+    clone = CanvasRectItem(item.rect())
+    clone.setPen(item.pen())
+    clone.setBrush(item.brush())
+    return clone
+
+
+def _clone_ellipse(item):
+    clone = CanvasEllipseItem(item.rect())
+    clone.setPen(item.pen())
+    clone.setBrush(item.brush())
+    return clone
+
+
+def _clone_text(item):
+    clone = CanvasTextItem(item.toPlainText())
+    clone.setFont(item.font())
+    clone.setDefaultTextColor(item.defaultTextColor())
+    clone._update_transform_origin()
+    return clone
+
+
+# (base class, value) ladders, checked in order; first match wins
+_CLONE_LADDER = (
+    (SelectionOverlay, None),
+    (RasterItem, _clone_raster),
+    (VectorItem, _clone_vector),
+    (QGraphicsRectItem, _clone_rect),
+    (QGraphicsEllipseItem, _clone_ellipse),
+    (QGraphicsTextItem, _clone_text),
+)
+_LAYER_NAME_LADDER = (
+    (QGraphicsRectItem, "Rectangle"),
+    (QGraphicsEllipseItem, "Ellipse"),
+    (RasterItem, "Image"),
+    (VectorItem, "Vector"),
+    (QGraphicsTextItem, "Text"),
+)
+# Concrete type -> resolved ladder value, so bulk copies and adds pay for
+# the isinstance walk once per item class rather than once per item
+_clone_dispatch = {}
+_layer_name_dispatch = {}
+
+
+def _dispatch_by_type(dispatch, ladder, item, default):
+    item_type = type(item)
+    try:
+        return dispatch[item_type]
+    except KeyError:
+        pass
+    value = default
+    for base, candidate in ladder:
+        if issubclass(item_type, base):
+            value = candidate
+            break
+    dispatch[item_type] = value
+    return value
+
+
 class ArtifactList(QListWidget):
     def __init__(self):
         super().__init__()
@@ -905,6 +1348,7 @@ class LayerList(QListWidget):
         self.setAcceptDrops(True)
         self.setDragDropMode(QListWidget.DragDropMode.InternalMove)
         self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self._list_items = {}  # graphics item -> its QListWidgetItem row
 
     def dropEvent(self, event):
         super().dropEvent(event)
@@ -912,13 +1356,26 @@ class LayerList(QListWidget):
 
     def update_z_orders(self):
         count = self.count()
-        for i in range(count):
-            item = self.item(i)
-            graphics_item = item.data(Qt.ItemDataRole.UserRole)
-            if graphics_item:
+        graphics_items = [self.item(i).data(Qt.ItemDataRole.UserRole) for i in range(count)]
+        for i, graphics_item in enumerate(graphics_items):
+            # A reorder only moves a few rows; leave the rest untouched so
+            # they don't each go through itemChange and re-sort the scene
+            if graphics_item and graphics_item.zValue() != count - i:
                 graphics_item.setZValue(count - i)
         self.scene.update()
 
+    def update_top_z_orders(self, rows):
+        """Number just the top rows after inserting them at row 0.
+
+        Rows below shift by the same amount the count grows, so their
+        count - i values, and therefore their Z, are unchanged.
+        """
+        count = self.count()
+        for i in range(min(rows, count)):
+            graphics_item = self.item(i).data(Qt.ItemDataRole.UserRole)
+            if graphics_item:
+                graphics_item.setZValue(count - i)
+
     def graphics_items(self):
         items = []
         for i in range(self.count()):
@@ -928,6 +1385,24 @@ class LayerList(QListWidget):
                 items.append(graphics_item)
         return items
 
+    def graphics_items_set(self):
+        """Live, read-only set view of the items that have a layer row."""
+        return self._list_items.keys()
+
+    def add_layer(self, list_item, row=0):
+        """Insert a layer row and index it by its graphics item."""
+        self.insertItem(row, list_item)
+        graphics_item = list_item.data(Qt.ItemDataRole.UserRole)
+        if graphics_item is not None:
+            self._list_items[graphics_item] = list_item
+
+    def list_item_for(self, graphics_item):
+        """Return the row for a graphics item, or None if it has none."""
+        list_item = self._list_items.get(graphics_item)
+        if list_item is None or sip.isdeleted(list_item):
+            return None
+        return list_item
+
     def remove_graphics_items(self, graphics_items):
         if not graphics_items:
             return
@@ -937,6 +1412,7 @@ class LayerList(QListWidget):
             graphics_item = list_item.data(Qt.ItemDataRole.UserRole)
             if graphics_item in graphics_items:
                 self.takeItem(i)
+                self._list_items.pop(graphics_item, None)
                 removed = True
         if removed:
             self.update_z_orders()
@@ -944,6 +1420,7 @@ class LayerList(QListWidget):
 
 class CanvasView(QGraphicsView):
     itemAdded = pyqtSignal(object)
+    itemsAdded = pyqtSignal(list)
     cursorMoved = pyqtSignal(object)
 
     def __init__(self, scene, artifact_list, main_window):
@@ -966,6 +1443,45 @@ class CanvasView(QGraphicsView):
         self._selection_creating = False
         self._selection_drop_active = False
         self._selection_drop_pos = None
+        self._text_editing_cached = None  # None = dirty, recompute on next query
+        scene.focusItemChanged.connect(self._invalidate_text_editing_cache)
+        self._clipboard_caps_cached = None  # None = dirty, re-probe on next context menu
+        QApplication.clipboard().dataChanged.connect(self._invalidate_clipboard_caps)
+        self.itemAdded.connect(self._watch_text_item)
+        self.itemsAdded.connect(self._watch_text_items)
+        self.handle_pool = HandlePool(scene)
+        self._load_relay = _ImageLoadRelay(QApplication.instance())
+        self._load_relay.loaded.connect(self._on_image_loaded)
+        # Mice can report moves well above the display rate; forward at most
+        # one cursor position per frame to the status bar
+        self._pending_cursor_pos = None
+        self._last_cursor_pos = None
+        self._cursor_timer = QTimer(self)
+        self._cursor_timer.setSingleShot(True)
+        self._cursor_timer.setInterval(16)
+        self._cursor_timer.timeout.connect(self._emit_cursor_moved)
+        # Overlay, shape and rotate/scale drags apply only the newest mouse
+        # position per event-loop pass instead of one update per move event
+        self._pending_drag_pos = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(0)
+        self._drag_timer.timeout.connect(self._flush_drag)
+        # Selection handles move nine small items per drag frame; repainting
+        # the whole viewport is cheaper than merging their dirty regions
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setOptimizationFlags(QGraphicsView.OptimizationFlag.DontSavePainterState
+                                  | QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing)
+        if main_window.settings.value("canvas/gpu_viewport", False, type=bool):
+            self._use_gpu_viewport()
+
+    def _use_gpu_viewport(self):
+        """Composite the scene through an OpenGL viewport instead of the raster engine."""
+        fmt = QSurfaceFormat()
+        fmt.setSamples(4)
+        gl_widget = QOpenGLWidget()
+        gl_widget.setFormat(fmt)
+        self.setViewport(gl_widget)
 
     def set_tool(self, tool):
         if self.current_tool == ToolType.SELECTION and tool != ToolType.SELECTION:
@@ -1066,7 +1582,10 @@ class CanvasView(QGraphicsView):
             text_item.enter_edit_mode(select_all=True)
             return
         elif self.current_tool in (ToolType.ROTATE, ToolType.SCALE):
-            item = self.scene().itemAt(scene_pos, self.transform())
+            # Reuse the press hit test; a handle stands in for its item
+            item = clicked_item
+            if isinstance(item, (ResizeHandle, RotateHandle)):
+                item = item.parent_item
             if item:
                 self._interacting_item = item
                 self._start_pos = scene_pos
@@ -1084,7 +1603,9 @@ class CanvasView(QGraphicsView):
             return
 
         scene_pos = self.mapToScene(event.pos())
-        self.cursorMoved.emit(scene_pos)
+        self._pending_cursor_pos = scene_pos
+        if not self._cursor_timer.isActive():
+            self._cursor_timer.start()
 
         # Delegate to active plugin tool first
         if self._active_plugin_tool and hasattr(self._active_plugin_tool, '_on_view_mouse_move'):
@@ -1093,7 +1614,7 @@ class CanvasView(QGraphicsView):
 
         if self.current_tool == ToolType.SELECTION:
             if self._selection_creating and self._selection_host:
-                self._selection_host.updateSelectionOverlay(scene_pos)
+                self._queue_drag(scene_pos)
                 return
             if self._selection_drop_active:
                 self._selection_drop_pos = scene_pos
@@ -1101,6 +1622,29 @@ class CanvasView(QGraphicsView):
             super().mouseMoveEvent(event)
             return
 
+        if self._drawing_item or self._interacting_item:
+            self._queue_drag(scene_pos)
+            return
+
+        super().mouseMoveEvent(event)
+
+    def _queue_drag(self, scene_pos):
+        """Defer a drag-driven geometry update to the next event-loop pass."""
+        self._pending_drag_pos = scene_pos
+        if not self._drag_timer.isActive():
+            self._drag_timer.start()
+
+    def _flush_drag(self):
+        """Apply the latest queued drag position, if any."""
+        self._drag_timer.stop()
+        scene_pos = self._pending_drag_pos
+        if scene_pos is None:
+            return
+        self._pending_drag_pos = None
+        if self.current_tool == ToolType.SELECTION:
+            if self._selection_creating and self._selection_host:
+                self._selection_host.updateSelectionOverlay(scene_pos)
+            return
         if self._drawing_item:
             rect = QRectF(self._start_pos, scene_pos).normalized()
             self._drawing_item.setRect(rect)
@@ -1121,9 +1665,15 @@ class CanvasView(QGraphicsView):
                 if start_dist > 0:
                     scale_factor = curr_dist / start_dist
                     self._interacting_item.setScale(self._start_scale * scale_factor)
-            return
 
-        super().mouseMoveEvent(event)
+    def _emit_cursor_moved(self):
+        scene_pos = self._pending_cursor_pos
+        self._pending_cursor_pos = None
+        # Jitter within one device pixel maps back to the same scene point
+        if scene_pos is None or scene_pos == self._last_cursor_pos:
+            return
+        self._last_cursor_pos = scene_pos
+        self.cursorMoved.emit(scene_pos)
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.MiddleButton:
@@ -1139,6 +1689,8 @@ class CanvasView(QGraphicsView):
             if self._active_plugin_tool._on_view_mouse_release(event):
                 return
 
+        # Land the final drag position before the gesture is committed
+        self._flush_drag()
         scene_pos = self.mapToScene(event.pos())
 
         if self.current_tool == ToolType.SELECTION:
@@ -1190,21 +1742,23 @@ class CanvasView(QGraphicsView):
 
     def dropEvent(self, event):
         if event.source() == self.artifact_list:
+            new_items = []
             for item in self.artifact_list.selectedItems():
                 pos = self.mapToScene(event.position().toPoint())
                 user_data = item.data(Qt.ItemDataRole.UserRole)
                 new_item = None
-                if isinstance(user_data, RasterItem):
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(user_data.image_bytes)
-                    new_item = RasterItem(pixmap)
-                    new_item.image_bytes = user_data.image_bytes
+                if isinstance(user_data, LazyRasterItem):
+                    new_item = user_data.create_item()
+                elif isinstance(user_data, RasterItem):
+                    new_item = RasterItem(user_data.pixmap())
                 elif isinstance(user_data, VectorItem):
                     renderer = user_data.renderer
                     new_item = VectorItem(renderer)
                 if new_item:
                     new_item.setPos(pos)
-                    self.itemAdded.emit(new_item)
+                    new_items.append(new_item)
+            if new_items:
+                self.itemsAdded.emit(new_items)
             event.acceptProposedAction()
         elif event.mimeData().hasUrls():
             scene_pos = self.mapToScene(event.position().toPoint())
@@ -1221,7 +1775,7 @@ class CanvasView(QGraphicsView):
             super().contextMenuEvent(event)
 
     def _show_context_menu(self, global_pos, scene_pos, clicked_items=None):
-        from functools import partial
+        """Show the canvas menu at global_pos (QPoint) for scene_pos (QPointF)."""
         menu = QMenu(self)
         actions_present = False
         overlay = self._current_overlay()
@@ -1242,11 +1796,7 @@ class CanvasView(QGraphicsView):
             menu.addAction(cancel_action)
             actions_present = True
 
-        if isinstance(scene_pos, QPoint):
-            scene_point = QPointF(scene_pos)
-        else:
-            scene_point = scene_pos
-        layer_items = set(self.main_window.layer_list.graphics_items())
+        layer_items = self.main_window.layer_list.graphics_items_set()
         selected_layer_items = [item for item in self.scene().selectedItems() if item in layer_items]
         if clicked_items:
             target_layer_items = [item for item in clicked_items if item in layer_items]
@@ -1273,69 +1823,57 @@ class CanvasView(QGraphicsView):
                 menu.addAction(edit_action)
             actions_present = True
 
-        clipboard = QApplication.clipboard()
-        mime_data = clipboard.mimeData()
-        can_paste = (
-            mime_data.hasText() or
-            mime_data.hasImage() or
-            mime_data.hasFormat('image/svg+xml') or
-            mime_data.hasUrls()
-        )
-        if can_paste:
+        if self._clipboard_can_paste():
             if actions_present:
                 menu.addSeparator()
             paste_action = QAction("Paste", self)
-            viewport_pos = self.mapFromScene(scene_point)
-            paste_action.triggered.connect(partial(self.paste_at_position, viewport_pos))
+            paste_action.triggered.connect(functools.partial(self.paste_at_scene_position, scene_pos))
             menu.addAction(paste_action)
 
         if menu.isEmpty():
             return False
-        if isinstance(global_pos, QPointF):
-            global_point = global_pos.toPoint()
-        else:
-            global_point = global_pos
-        menu.exec(global_point)
+        menu.exec(global_pos)
         return True
 
     def paste_at_position(self, pos):
+        """Paste the clipboard at a viewport position."""
+        self.paste_at_scene_position(self.mapToScene(pos))
+
+    def paste_at_scene_position(self, scene_pos):
         clipboard = QApplication.clipboard()
         mime_data = clipboard.mimeData()
-        scene_pos = self.mapToScene(pos)
         if self._try_paste_from_urls(mime_data, scene_pos):
             return
+        log_pastes = self.main_window.settings.value("canvas/log_pastes", False, type=bool)
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
         if mime_data.hasFormat('image/svg+xml'):
             svg_data = mime_data.data('image/svg+xml')
-            log_path = f"pasted_logs/svg_{timestamp}.svg"
-            with open(log_path, 'wb') as f:
-                f.write(svg_data)
-            print(f"Logged SVG to {log_path}")
+            if log_pastes:
+                self._queue_log_write(f"pasted_logs/svg_{timestamp}.svg", bytes(svg_data))
             renderer = QSvgRenderer(svg_data)
             item = VectorItem(renderer)
             item.setPos(scene_pos)
             self.itemAdded.emit(item)
-            self.main_window.add_artifact(log_path)
+            self.main_window.add_to_repository(
+                VectorItem(renderer),
+                thumbnail_pixmap=self.main_window._render_svg_thumbnail(renderer))
             return
         if mime_data.hasImage():
             image = mime_data.imageData()
+            if log_pastes:
+                self._queue_log_write(f"pasted_logs/image_{timestamp}.png", image)
             pixmap = QPixmap.fromImage(image)
-            log_path = f"pasted_logs/image_{timestamp}.png"
-            pixmap.save(log_path)
-            print(f"Logged image to {log_path}")
             item = RasterItem(pixmap)
             item.setPos(scene_pos)
             self.itemAdded.emit(item)
-            self.main_window.add_artifact(log_path)
+            self.main_window.add_to_repository(RasterItem(pixmap), thumbnail_pixmap=pixmap)
             return
         if mime_data.hasText():
             text = mime_data.text()
             if self._try_paste_path_from_text(text, scene_pos):
                 return
-            log_path = f"pasted_logs/text_{timestamp}.txt"
-            with open(log_path, 'w') as f:
-                f.write(text)
-            print(f"Logged text to {log_path}")
+            if log_pastes:
+                self._queue_log_write(f"pasted_logs/text_{timestamp}.txt", text)
             text_item = CanvasTextItem(text)
             text_item.setPos(scene_pos)
             text_item.setFont(QFont("Arial", 12))
@@ -1352,20 +1890,51 @@ class CanvasView(QGraphicsView):
             self.artifact_list.addItem(list_item)
             return
 
+    @staticmethod
+    def _queue_log_write(path, data):
+        """Write a paste log (QImage, bytes or str) on the thread pool."""
+        def write():
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if isinstance(data, QImage):
+                    if not data.save(path):
+                        raise OSError(f"could not encode {path}")
+                else:
+                    with open(path, 'wb' if isinstance(data, bytes) else 'w') as f:
+                        f.write(data)
+                log.debug("Logged paste to %s", path)
+            except OSError as exc:
+                log.warning("Failed to log paste to %s: %s", path, exc)
+
+        QThreadPool.globalInstance().start(write)
+
     def _try_paste_from_urls(self, mime_data, scene_pos):
         if not mime_data.hasUrls():
             return False
         offset_step = QPointF(25, 25)
         handled = False
+        # All files join one itemsAdded batch, in drop order
+        batch = _PasteBatch()
         for index, url in enumerate(mime_data.urls()):
             path = url.toLocalFile()
             if not path:
                 continue
             pos = scene_pos + QPointF(offset_step.x() * index, offset_step.y() * index)
-            if self._paste_file_path(path, pos):
+            if self._paste_file_path(path, pos, batch):
                 handled = True
+        batch.sealed = True
+        self._flush_paste_batch(batch)
         return handled
 
+    def _flush_paste_batch(self, batch):
+        """Emit the batch once it is sealed and every decode has come back."""
+        if not batch.sealed or batch.pending:
+            return
+        items = [item for item in batch.items if item is not None]
+        batch.items = []
+        if items:
+            self.itemsAdded.emit(items)
+
     def _try_paste_path_from_text(self, text, scene_pos):
         if not text:
             return False
@@ -1376,43 +1945,86 @@ class CanvasView(QGraphicsView):
             candidate = QUrl(candidate).toLocalFile()
         return self._paste_file_path(candidate, scene_pos)
 
-    def _paste_file_path(self, path, scene_pos):
+    def _paste_file_path(self, path, scene_pos, batch=None):
+        """Place the file at scene_pos, appending to batch instead of emitting if given."""
         if not path:
             return False
-        path = os.path.expanduser(path)
-        if not os.path.isfile(path):
+        if path.startswith('~'):
+            path = os.path.expanduser(path)
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in _RASTER_EXTS and ext not in _VECTOR_EXTS:
             return False
-        lower = path.lower()
-        item = None
-        if lower.endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')):
-            pixmap = QPixmap(path)
-            if pixmap.isNull():
+        try:
+            if not stat.S_ISREG(os.stat(path).st_mode):
                 return False
-            # Check if we should scale large images
-            scale_large = self.main_window.settings.value("canvas/scale_large_images", False, type=bool)
-            if scale_large:
-                viewport_size = self.viewport().size()
-                max_width = viewport_size.width() * 0.9
-                max_height = viewport_size.height() * 0.9
-                if pixmap.width() > max_width or pixmap.height() > max_height:
-                    pixmap = pixmap.scaled(
-                        int(max_width), int(max_height),
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-            item = RasterItem(pixmap)
-        elif lower.endswith('.svg'):
-            renderer = QSvgRenderer(path)
-            if not renderer.isValid():
+        except (OSError, ValueError):
+            return False
+        if ext in _RASTER_EXTS:
+            # Only the header is read here; decoding happens on the pool
+            if not QImageReader(path).canRead():
                 return False
-            item = VectorItem(renderer)
-        if not item:
+            if batch is None:
+                self._load_image_async(path, scene_pos)
+            else:
+                self._load_image_async(path, scene_pos, batch, batch.reserve())
+            return True
+        renderer = QSvgRenderer(path)
+        if not renderer.isValid():
             return False
+        item = VectorItem(renderer)
         item.setPos(scene_pos)
-        self.itemAdded.emit(item)
-        self.main_window.add_artifact(path)
+        if batch is None:
+            self.itemAdded.emit(item)
+        else:
+            batch.items.append(item)
+        self.main_window.add_to_repository(
+            VectorItem(renderer),
+            thumbnail_pixmap=self.main_window._render_svg_thumbnail(renderer))
         return True
 
+    def _load_image_async(self, path, scene_pos, batch=None, slot=-1):
+        """Decode an image file on the thread pool; see _on_image_loaded."""
+        max_size = None
+        # Check if we should scale large images
+        if self.main_window.settings.value("canvas/scale_large_images", False, type=bool):
+            viewport_size = self.viewport().size()
+            max_size = QSize(int(viewport_size.width() * 0.9), int(viewport_size.height() * 0.9))
+        relay = self._load_relay
+
+        def load():
+            # QImage, unlike QPixmap, may be created off the GUI thread
+            image = QImageReader(path).read()
+            if max_size is not None and not image.isNull():
+                if image.width() > max_size.width() or image.height() > max_size.height():
+                    image = image.scaled(
+                        max_size,
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+            # Thumbnail from the decoded image rather than a second read of the file
+            thumb = _make_thumb(image) if not image.isNull() else QImage()
+            # The view may be gone by now; the relay outlives it
+            relay.loaded.emit(image, thumb, scene_pos, path, batch, slot)
+
+        QThreadPool.globalInstance().start(load)
+
+    def _on_image_loaded(self, image, thumb, scene_pos, path, batch, slot):
+        if image.isNull():
+            self.main_window.statusBar().showMessage(f"Could not load {os.path.basename(path)}", 4000)
+            if batch is not None:
+                batch.pending -= 1
+                self._flush_paste_batch(batch)
+            return
+        item = RasterItem(QPixmap.fromImage(image))
+        item.setPos(scene_pos)
+        if batch is None:
+            self.itemAdded.emit(item)
+        else:
+            batch.items[slot] = item
+            batch.pending -= 1
+            self._flush_paste_batch(batch)
+        self.main_window.add_to_repository(LazyRasterItem(path), thumbnail_pixmap=QPixmap.fromImage(thumb))
+
     def mouseDoubleClickEvent(self, event):
         if (self.current_tool == ToolType.SELECTION and
                 event.button() == Qt.MouseButton.LeftButton and
@@ -1516,7 +2128,7 @@ class CanvasView(QGraphicsView):
         if overlay_active:
             self._copy_selection()
             return True
-        layer_items = set(self.main_window.layer_list.graphics_items())
+        layer_items = self.main_window.layer_list.graphics_items_set()
         selected_items = [
             item for item in self.scene().selectedItems()
             if item in layer_items
@@ -1530,40 +2142,25 @@ class CanvasView(QGraphicsView):
                 clones.append(clone)
         if not clones:
             return False
-        for clone in clones:
-            self.itemAdded.emit(clone)
-        self.scene().clearSelection()
-        for clone in clones:
-            clone.setSelected(True)
+        # add_items_to_canvas leaves exactly the clones selected
+        self.itemsAdded.emit(clones)
         return True
 
     def _clone_item(self, item):
-        if isinstance(item, SelectionOverlay):
+        cloner = _dispatch_by_type(_clone_dispatch, _CLONE_LADDER, item, None)
+        if cloner is None:
             return None
-        if isinstance(item, RasterItem):
-            clone = RasterItem(item.pixmap().copy())
-        elif isinstance(item, VectorItem):
-            clone = VectorItem(item.renderer)
-        elif isinstance(item, QGraphicsRectItem) and not isinstance(item, SelectionOverlay):
-            clone = CanvasRectItem(item.rect())
-            clone.setPen(item.pen())
-            clone.setBrush(item.brush())
-        elif isinstance(item, QGraphicsEllipseItem):
-            clone = CanvasEllipseItem(item.rect())
-            clone.setPen(item.pen())
-            clone.setBrush(item.brush())
-        elif isinstance(item, QGraphicsTextItem):
-            clone = CanvasTextItem(item.toPlainText())
-            clone.setFont(item.font())
-            clone.setDefaultTextColor(item.defaultTextColor())
-            clone._update_transform_origin()
-        else:
-            return None
-        clone.setFlags(item.flags())
+        clone = cloner(item)
+        # Position/rotation/scale stay as separate properties (undo, rotate tool
+        # and selection math read them back), but are applied with geometry
+        # notifications off so each setter doesn't round-trip through itemChange.
+        flags = item.flags()
+        clone.setFlags(flags & ~QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
         clone.setTransformOriginPoint(item.transformOriginPoint())
-        clone.setPos(item.scenePos() + QPointF(15, 15))
+        clone.setPos(item.scenePos() + _CLONE_OFFSET)
         clone.setRotation(item.rotation())
         clone.setScale(item.scale())
+        clone.setFlags(flags)
         return clone
 
     def _cancel_selection_mode(self):
@@ -1576,26 +2173,59 @@ class CanvasView(QGraphicsView):
         self._apply_cursor()
 
     def _apply_cursor(self):
-        if self.current_tool == ToolType.SELECTION:
-            if self._selection_creating or self._selection_drop_active or not self._selection_host:
-                self.setCursor(Qt.CursorShape.CrossCursor)
-            else:
-                self.setCursor(Qt.CursorShape.ArrowCursor)
-        elif self.current_tool == ToolType.SELECT:
-            self.setCursor(Qt.CursorShape.ArrowCursor)
-        else:
-            self.setCursor(Qt.CursorShape.ArrowCursor)
+        selecting = self.current_tool == ToolType.SELECTION
+        awaiting_region = (
+            self._selection_creating or
+            self._selection_drop_active or
+            not self._selection_host
+        )
+        shape = _CURSOR_TABLE[(selecting, selecting and awaiting_region)]
+        # Compare against the live cursor rather than a cached shape, since
+        # plugins (e.g. crop tool) set/unset the view cursor directly.
+        if self.cursor().shape() != shape:
+            self.setCursor(shape)
 
     def _is_text_editing_active(self):
-        focus_item = self.scene().focusItem()
-        return isinstance(focus_item, CanvasTextItem) and focus_item.is_editing()
+        if self._text_editing_cached is None:
+            focus_item = self.scene().focusItem()
+            self._text_editing_cached = isinstance(focus_item, CanvasTextItem) and focus_item.is_editing()
+        return self._text_editing_cached
+
+    def _invalidate_text_editing_cache(self, *_args):
+        self._text_editing_cached = None
+
+    def _clipboard_can_paste(self):
+        # Each has*() probe may round-trip to the system clipboard, so only
+        # ask again once the clipboard reports new contents
+        if self._clipboard_caps_cached is None:
+            mime_data = QApplication.clipboard().mimeData()
+            self._clipboard_caps_cached = mime_data is not None and (
+                mime_data.hasText() or
+                mime_data.hasImage() or
+                mime_data.hasFormat('image/svg+xml') or
+                mime_data.hasUrls()
+            )
+        return self._clipboard_caps_cached
+
+    def _invalidate_clipboard_caps(self):
+        self._clipboard_caps_cached = None
+
+    def _watch_text_item(self, item):
+        if isinstance(item, CanvasTextItem):
+            item.editingStateChanged.connect(self._invalidate_text_editing_cache)
+
+    def _watch_text_items(self, items):
+        for item in items:
+            self._watch_text_item(item)
 
     def active_selection_host(self):
         return self._selection_host
 
-    def handle_items_deleted(self, deleted_items):
+    def handle_items_deleted(self, deleted_items: set):
         if not deleted_items:
             return
+        if not isinstance(deleted_items, (set, frozenset)):
+            deleted_items = set(deleted_items)
         if self._selection_host and self._selection_host in deleted_items:
             self._cancel_selection_mode()
         if self._interacting_item and self._interacting_item in deleted_items:
@@ -1604,21 +2234,26 @@ class CanvasView(QGraphicsView):
             self._drawing_item = None
 
 
+_DARK_WINDOW = QColor(53, 53, 53)
+_DARK_BASE = QColor(25, 25, 25)
+_DARK_ACCENT = QColor(42, 130, 218)
+
+
 def apply_dark_theme(app):
     app.setStyle("Fusion")
     dark_palette = QPalette()
-    dark_palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
+    dark_palette.setColor(QPalette.ColorRole.Window, _DARK_WINDOW)
     dark_palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.white)
-    dark_palette.setColor(QPalette.ColorRole.Base, QColor(25, 25, 25))
-    dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
+    dark_palette.setColor(QPalette.ColorRole.Base, _DARK_BASE)
+    dark_palette.setColor(QPalette.ColorRole.AlternateBase, _DARK_WINDOW)
     dark_palette.setColor(QPalette.ColorRole.ToolTipBase, Qt.GlobalColor.white)
     dark_palette.setColor(QPalette.ColorRole.ToolTipText, Qt.GlobalColor.white)
     dark_palette.setColor(QPalette.ColorRole.Text, Qt.GlobalColor.white)
-    dark_palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
+    dark_palette.setColor(QPalette.ColorRole.Button, _DARK_WINDOW)
     dark_palette.setColor(QPalette.ColorRole.ButtonText, Qt.GlobalColor.white)
     dark_palette.setColor(QPalette.ColorRole.BrightText, Qt.GlobalColor.red)
-    dark_palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
+    dark_palette.setColor(QPalette.ColorRole.Link, _DARK_ACCENT)
+    dark_palette.setColor(QPalette.ColorRole.Highlight, _DARK_ACCENT)
     dark_palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black)
     app.setPalette(dark_palette)
     
@@ -1642,6 +2277,79 @@ def apply_dark_theme(app):
     """)
 
 
+TOOLBAR_TABLE_ICON_SIZE = 32
+TOOLBAR_ICON_SIZE = 48
+EXPORT_FILE_NAME_FORMAT = "canvas_export_%Y%m%d_%H%M%S.png"
+REPOSITORY_THUMB_SIZE = 50
+_MISSING_ICON_PATH = "Built-in / Missing"
+
+# Dashed red box with the icon name, shown when no icon file is found
+PLACEHOLDER_SVG_TEMPLATE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="48" height="48">'
+    '<rect x="0.5" y="0.5" width="47" height="47" fill="none" '
+    'stroke="#ff0000" stroke-opacity="0.5" stroke-dasharray="3,3"/>'
+    '<text x="24" y="27" font-size="8" fill="red" text-anchor="middle">{label}</text>'
+    '</svg>'
+)
+_placeholder_icon_cache = {}
+
+
+def _make_thumb(pixmap, target=REPOSITORY_THUMB_SIZE):
+    """Halve with fast scaling down to ~2x the target, then finish smoothly.
+
+    Accepts a QPixmap or, off the GUI thread, a QImage.
+    """
+    width, height = pixmap.width(), pixmap.height()
+    while width > target * 2 and height > target * 2:
+        width, height = width // 2, height // 2
+        pixmap = pixmap.scaled(width, height, Qt.AspectRatioMode.IgnoreAspectRatio,
+                               Qt.TransformationMode.FastTransformation)
+    return pixmap.scaled(target, target, Qt.AspectRatioMode.KeepAspectRatio,
+                         Qt.TransformationMode.SmoothTransformation)
+
+
+@functools.lru_cache(maxsize=256)
+def _icon_for(path_str, size):
+    """Load an icon file once, pre-rasterized at the given square size."""
+    icon = QIcon()
+    pixmap = QIcon(path_str).pixmap(size, size)
+    if not pixmap.isNull():
+        icon.addPixmap(pixmap)
+    return icon
+
+
+def _toolbar_icon(path_str):
+    """SVGs are rasterized once at toolbar size; PNGs stay lazy until first paint."""
+    if path_str.endswith('.svg'):
+        return _icon_for(path_str, TOOLBAR_ICON_SIZE)
+    icon = QIcon()
+    icon.addFile(path_str, QSize(TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE))
+    return icon
+
+
+# (key, default, type) per QSettings group read by PreferencesDialog
+_PREF_GROUP_KEYS = {
+    "canvas": (
+        ("import_behavior", "keep", str),
+        ("scale_large_images", False, bool),
+        ("export_mode", "all", str),
+        ("gpu_viewport", False, bool),
+        ("log_pastes", False, bool),
+    ),
+    "appearance": (
+        ("icon_theme", "default", str),
+    ),
+    "window": (
+        ("startup_mode", "last", str),
+        ("startup_monitor", 0, int),
+        ("startup_state_pref", "normal", str),
+    ),
+    "plugins": (
+        ("editor_path", "code", str),
+    ),
+}
+
+
 class PreferencesDialog(QDialog):
     """Preferences dialog with organized settings sections."""
     
@@ -1662,8 +2370,37 @@ class PreferencesDialog(QDialog):
         self._save_dir_changed = False
         self._library_dir_changed = False
         
+        # Snapshot screens and window prefs once per dialog open
+        screens = parent._screens() if isinstance(parent, MainWindow) else QApplication.screens()
+        self._screen_names = [screen.name() for screen in screens]
+        self._canvas_prefs = self._read_settings_group("canvas")
+        self._appearance_prefs = self._read_settings_group("appearance")
+        self._window_prefs = self._read_settings_group("window")
+        self._plugin_prefs = self._read_settings_group("plugins")
+        
+        # plugin id -> PluginManifest, filled on first plugin list population
+        self._discovered_cache = None
+        # plugin id -> details HTML, rebuilt alongside the list rows
+        self._plugin_details_html = {}
+        
         self._setup_ui()
     
+    def _read_settings_group(self, group):
+        """Prefetch every known key of a settings group in one beginGroup pass."""
+        keys = _PREF_GROUP_KEYS[group]
+        prefs = {key: default for key, default, _ in keys}
+        if not self.settings:
+            return prefs
+        self.settings.beginGroup(group)
+        try:
+            stored = set(self.settings.childKeys())
+            for key, default, value_type in keys:
+                if key in stored:
+                    prefs[key] = self.settings.value(key, default, type=value_type)
+        finally:
+            self.settings.endGroup()
+        return prefs
+    
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         
@@ -1677,8 +2414,11 @@ class PreferencesDialog(QDialog):
         self.tab_widget.addTab(self._create_appearance_tab(), "Appearance")
         self.tab_widget.addTab(self._create_toolbar_tab(), "Toolbar")
         self.tab_widget.addTab(self._create_window_tab(), "Window")
-        self.tab_widget.addTab(self._create_plugins_tab(), "Plugins")
+        self._plugins_tab = self._create_plugins_tab()
+        self._plugins_tab._built = False
+        self.tab_widget.addTab(self._plugins_tab, "Plugins")
         self.tab_widget.addTab(self._create_about_tab(), "About")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         # Dialog buttons
         button_box = QDialogButtonBox(
@@ -1768,7 +2508,7 @@ class PreferencesDialog(QDialog):
         self.import_behavior_combo.addItem("Zoom to fit new item only", "fit_new")
         
         # Load saved preference
-        saved_behavior = self.settings.value("canvas/import_behavior", "keep") if self.settings else "keep"
+        saved_behavior = self._canvas_prefs["import_behavior"]
         idx = self.import_behavior_combo.findData(saved_behavior)
         if idx >= 0:
             self.import_behavior_combo.setCurrentIndex(idx)
@@ -1794,7 +2534,7 @@ class PreferencesDialog(QDialog):
         sizing_layout.setSpacing(10)
         
         self.scale_large_checkbox = QCheckBox("Scale down images larger than viewport")
-        saved_scale = self.settings.value("canvas/scale_large_images", False, type=bool) if self.settings else False
+        saved_scale = self._canvas_prefs["scale_large_images"]
         self.scale_large_checkbox.setChecked(saved_scale)
         sizing_layout.addRow(self.scale_large_checkbox)
         
@@ -1804,6 +2544,59 @@ class PreferencesDialog(QDialog):
         sizing_layout.addRow("", scale_desc)
         
         layout.addWidget(sizing_group)
+        
+        # Save/Export Group
+        export_group = QGroupBox("Save && Export")
+        export_layout = QFormLayout(export_group)
+        export_layout.setSpacing(10)
+        
+        self.export_mode_combo = QComboBox()
+        self.export_mode_combo.addItem("All items", "all")
+        self.export_mode_combo.addItem("Visible area only", "viewport")
+        idx = self.export_mode_combo.findData(self._canvas_prefs["export_mode"])
+        if idx >= 0:
+            self.export_mode_combo.setCurrentIndex(idx)
+        export_layout.addRow("Save canvas as:", self.export_mode_combo)
+        
+        export_desc = QLabel("Visible area only renders what is currently shown in the canvas view.")
+        export_desc.setStyleSheet("color: #888; font-size: 11px;")
+        export_desc.setWordWrap(True)
+        export_layout.addRow("", export_desc)
+        
+        layout.addWidget(export_group)
+        
+        # Rendering Group
+        render_group = QGroupBox("Rendering")
+        render_layout = QFormLayout(render_group)
+        render_layout.setSpacing(10)
+        
+        self.gpu_viewport_checkbox = QCheckBox("Use GPU-accelerated canvas")
+        self.gpu_viewport_checkbox.setChecked(self._canvas_prefs["gpu_viewport"])
+        render_layout.addRow(self.gpu_viewport_checkbox)
+        
+        gpu_desc = QLabel("Composites the canvas with OpenGL. Takes effect after restart. "
+                          "Leave off if the desktop freezes on Wayland with NVIDIA drivers.")
+        gpu_desc.setStyleSheet("color: #888; font-size: 11px;")
+        gpu_desc.setWordWrap(True)
+        render_layout.addRow("", gpu_desc)
+        
+        layout.addWidget(render_group)
+        
+        # Clipboard Group
+        clipboard_group = QGroupBox("Clipboard")
+        clipboard_layout = QFormLayout(clipboard_group)
+        clipboard_layout.setSpacing(10)
+        
+        self.log_pastes_checkbox = QCheckBox("Keep a copy of pasted content")
+        self.log_pastes_checkbox.setChecked(self._canvas_prefs["log_pastes"])
+        clipboard_layout.addRow(self.log_pastes_checkbox)
+        
+        log_desc = QLabel("Writes each pasted image, SVG or text snippet to pasted_logs/ in the working directory.")
+        log_desc.setStyleSheet("color: #888; font-size: 11px;")
+        log_desc.setWordWrap(True)
+        clipboard_layout.addRow("", log_desc)
+        
+        layout.addWidget(clipboard_group)
         layout.addStretch()
         
         return widget
@@ -1824,11 +2617,12 @@ class PreferencesDialog(QDialog):
         # Scan for other themes in assets/toolbar_icons
         base_dir = Path(__file__).parent / "assets" / "toolbar_icons"
         if base_dir.exists():
-            for item in base_dir.iterdir():
-                if item.is_dir():
-                    self.theme_combo.addItem(item.name.capitalize(), item.name)
+            with os.scandir(base_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        self.theme_combo.addItem(entry.name.capitalize(), entry.name)
         
-        current_theme = self.settings.value("appearance/icon_theme", "default")
+        current_theme = self._appearance_prefs["icon_theme"]
         idx = self.theme_combo.findData(current_theme)
         if idx >= 0:
             self.theme_combo.setCurrentIndex(idx)
@@ -1886,11 +2680,7 @@ class PreferencesDialog(QDialog):
                 
             # Copy files (simple shallow copy of images)
             # We copy all .png and .svg files
-            count = 0
-            for item in src_dir.iterdir():
-                if item.is_file() and item.suffix.lower() in ('.png', '.svg'):
-                    shutil.copy2(item, new_theme_dir / item.name)
-                    count += 1
+            count = self._copy_theme_icons(src_dir, new_theme_dir)
             
             QMessageBox.information(self, "Theme Created", f"Created theme '{safe_name}' with {count} icons.")
             
@@ -1902,6 +2692,21 @@ class PreferencesDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to create theme: {e}")
 
+    @staticmethod
+    def _copy_theme_icons(src_dir, dest_dir):
+        """Copy every .png/.svg in src_dir into dest_dir, returns the file count."""
+        with os.scandir(src_dir) as entries:
+            sources = [
+                entry.path for entry in entries
+                if entry.is_file() and entry.name.lower().endswith(('.png', '.svg'))
+            ]
+        if not sources:
+            return 0
+        # Copies are I/O bound, so overlap them instead of waiting on each file
+        with ThreadPoolExecutor(max_workers=min(8, len(sources))) as pool:
+            list(pool.map(lambda src: shutil.copy2(src, dest_dir / os.path.basename(src)), sources))
+        return len(sources)
+
     def get_icon_theme(self):
         return self.theme_combo.currentData()
 
@@ -1934,7 +2739,7 @@ class PreferencesDialog(QDialog):
         self.toolbar_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.toolbar_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
         self.toolbar_table.setMinimumHeight(300)
-        self.toolbar_table.setIconSize(QSize(32, 32))
+        self.toolbar_table.setIconSize(QSize(TOOLBAR_TABLE_ICON_SIZE, TOOLBAR_TABLE_ICON_SIZE))
         order_layout.addWidget(self.toolbar_table)
         
         # Buttons
@@ -1987,7 +2792,7 @@ class PreferencesDialog(QDialog):
         png = base_dir / f"{icon_name}.png"
         if png.exists(): return str(png)
         
-        return "Built-in / Missing"
+        return _MISSING_ICON_PATH
 
     def _populate_toolbar_order_list(self):
         """Populate the toolbar table."""
@@ -1997,17 +2802,17 @@ class PreferencesDialog(QDialog):
             return
         
         order = self.main_window._get_toolbar_order()
-        action_defs = self.main_window._toolbar_action_defs
+        action_rows = self.main_window._toolbar_action_fast
         
         for action_id in order:
-            if action_id not in action_defs:
+            action_row = action_rows.get(action_id)
+            if action_row is None:
                 continue
             
-            action_def = action_defs[action_id]
             row = self.toolbar_table.rowCount()
             self.toolbar_table.insertRow(row)
             
-            if action_def.get("is_separator"):
+            if action_row.is_sep:
                 # Separator
                 item_name = QTableWidgetItem("── Separator ──")
                 item_name.setForeground(QColor("#888"))
@@ -2015,26 +2820,27 @@ class PreferencesDialog(QDialog):
                 self.toolbar_table.setItem(row, 1, item_name)
             else:
                 # Tool
-                text = action_def.get("text", action_id)
-                is_core = action_def.get("is_core", False)
-                prefix = "⚙️ " if is_core else "🔌 "
+                prefix = "⚙️ " if action_row.is_core else "🔌 "
+                
+                icon_name = action_row.icon_name
+                path = self._resolve_icon_path(icon_name) if icon_name else None
                 
                 # Icon Item
                 icon_item = QTableWidgetItem()
-                action = action_def.get("action")
-                if action and not action.icon().isNull():
+                action = action_row.action
+                if path and path != _MISSING_ICON_PATH:
+                    icon_item.setIcon(_icon_for(path, TOOLBAR_TABLE_ICON_SIZE))
+                elif action and not action.icon().isNull():
                     icon_item.setIcon(action.icon())
                 self.toolbar_table.setItem(row, 0, icon_item)
                 
                 # Name Item
-                name_item = QTableWidgetItem(f"{prefix}{text}")
+                name_item = QTableWidgetItem(f"{prefix}{action_row.text}")
                 name_item.setData(Qt.ItemDataRole.UserRole, action_id)
                 self.toolbar_table.setItem(row, 1, name_item)
                 
                 # Path Item
-                icon_name = action_def.get("icon_name", "")
-                if icon_name:
-                    path = self._resolve_icon_path(icon_name)
+                if path:
                     path_item = QTableWidgetItem(path)
                     path_item.setToolTip(path)
                     self.toolbar_table.setItem(row, 2, path_item)
@@ -2100,6 +2906,9 @@ class PreferencesDialog(QDialog):
                 
                 try:
                     shutil.copy2(src_path, dest_path)
+                    _icon_for.cache_clear()
+                    # The toolbar's resolved-path table still names the old file
+                    self.main_window._invalidate_icon_cache()
                     
                     # If we switched extensions (e.g. png to svg), remove the old one to avoid conflict priorities
                     other_ext = ".png" if scaling_ext == ".svg" else ".svg"
@@ -2107,9 +2916,20 @@ class PreferencesDialog(QDialog):
                     if other_path.exists():
                         other_path.unlink()
                         
-                    # Update UI
-                    self.main_window._setup_toolbar_actions() # Reloads icons in main window
-                    self._populate_toolbar_order_list() # Reloads table
+                    # Update just the affected action and table row; the live
+                    # toolbar only follows edits to the theme it is showing,
+                    # since the dialog's theme choice may still be cancelled
+                    dest_str = str(dest_path)
+                    active_theme = self.settings.value("appearance/icon_theme", "default")
+                    if current_theme == active_theme:
+                        self.main_window.update_action_icon(action_id, dest_str)
+                    icon_cell = self.toolbar_table.item(row, 0)
+                    if icon_cell:
+                        icon_cell.setIcon(_icon_for(dest_str, TOOLBAR_TABLE_ICON_SIZE))
+                    path_cell = self.toolbar_table.item(row, 2)
+                    if path_cell:
+                        path_cell.setText(dest_str)
+                        path_cell.setToolTip(dest_str)
                     
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to save icon: {e}")
@@ -2188,7 +3008,7 @@ class PreferencesDialog(QDialog):
         self.startup_mode_combo.addItem("Open on Specific Monitor", "monitor")
         self.startup_mode_combo.addItem("Open on Screen with Mouse", "mouse")
         
-        saved_mode = self.settings.value("window/startup_mode", "last")
+        saved_mode = self._window_prefs["startup_mode"]
         idx = self.startup_mode_combo.findData(saved_mode)
         if idx >= 0:
             self.startup_mode_combo.setCurrentIndex(idx)
@@ -2197,12 +3017,10 @@ class PreferencesDialog(QDialog):
         
         # Monitor Selection (Dynamic)
         self.monitor_combo = QComboBox()
-        screens = QApplication.screens()
-        for i, screen in enumerate(screens):
-            name = screen.name()
+        for i, name in enumerate(self._screen_names):
             self.monitor_combo.addItem(f"Monitor {i+1}: {name}", i)
             
-        saved_monitor = self.settings.value("window/startup_monitor", 0, type=int)
+        saved_monitor = self._window_prefs["startup_monitor"]
         if saved_monitor < self.monitor_combo.count():
             self.monitor_combo.setCurrentIndex(saved_monitor)
             
@@ -2220,7 +3038,7 @@ class PreferencesDialog(QDialog):
         self.window_state_combo.addItem("Maximized", "maximized")
         self.window_state_combo.addItem("Full Screen", "fullscreen")
         
-        saved_state = self.settings.value("window/startup_state_pref", "normal")
+        saved_state = self._window_prefs["startup_state_pref"]
         idx = self.window_state_combo.findData(saved_state)
         if idx >= 0:
             self.window_state_combo.setCurrentIndex(idx)
@@ -2249,31 +3067,8 @@ class PreferencesDialog(QDialog):
             "state": self.window_state_combo.currentData()
         }
     
-    def get_import_behavior(self):
-        """Return the selected import behavior setting."""
-        return self.import_behavior_combo.currentData()
-    
-    def get_scale_large_images(self):
-        """Return whether to scale large images."""
-        return self.scale_large_checkbox.isChecked()
-    
-    def accept(self):
-        """Save settings when dialog is accepted."""
-        if self.settings:
-            self.settings.setValue("canvas/import_behavior", self.get_import_behavior())
-            self.settings.setValue("canvas/scale_large_images", self.get_scale_large_images())
-            win_settings = self.get_window_settings()
-            self.settings.setValue("window/startup_mode", win_settings["mode"])
-            self.settings.setValue("window/startup_monitor", win_settings["monitor"])
-            self.settings.setValue("window/startup_state_pref", win_settings["state"])
-            self.settings.setValue("plugins/editor_path", self.get_editor_path())
-            self.settings.setValue("appearance/icon_theme", self.get_icon_theme())
-        super().accept()
-    
     def _create_plugins_tab(self):
         """Create the Plugins settings tab."""
-        from PyQt6.QtWidgets import QListWidget, QListWidgetItem, QTextEdit
-        
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setSpacing(15)
@@ -2326,7 +3121,7 @@ class PreferencesDialog(QDialog):
         editor_row.setContentsMargins(0, 0, 0, 0)
         
         self.editor_path_edit = QLineEdit()
-        saved_editor = self.settings.value("plugins/editor_path", "code") if self.settings else "code"
+        saved_editor = self._plugin_prefs["editor_path"]
         self.editor_path_edit.setText(saved_editor)
         self.editor_path_edit.setPlaceholderText("code (VS Code)")
         editor_row.addWidget(self.editor_path_edit)
@@ -2343,74 +3138,98 @@ class PreferencesDialog(QDialog):
         
         layout.addWidget(editor_group)
         
-        # Populate plugin list
-        self._populate_plugin_list()
+        # Plugin list is populated on first view (see _on_tab_changed)
         
         layout.addStretch()
         return widget
     
+    def _on_tab_changed(self, index):
+        """Scan plugins only the first time the Plugins tab is shown."""
+        if self.tab_widget.widget(index) is self._plugins_tab and not self._plugins_tab._built:
+            self._plugins_tab._built = True
+            self._populate_plugin_list()
+    
     def _populate_plugin_list(self):
         """Populate the plugin list with discovered plugins."""
+        # Selection slots are re-driven explicitly by callers once the list is final
+        with QSignalBlocker(self.plugin_list):
+            self._fill_plugin_list()
+    
+    def _fill_plugin_list(self):
         self.plugin_list.clear()
         
         if not self.plugin_manager:
             return
         
-        # Get all discovered plugins
-        for manifest in self.plugin_manager.discover_plugins():
+        # Scan once, reuse for selection until a reload/toggle invalidates it
+        if self._discovered_cache is None:
+            self._discovered_cache = {
+                manifest.id: manifest for manifest in self.plugin_manager.discover_plugins()
+            }
+        
+        self._plugin_details_html = {}
+        for manifest in self._discovered_cache.values():
             item = QListWidgetItem()
             loaded = self.plugin_manager.get_plugin(manifest.id)
             
             status = "✓" if loaded and loaded.enabled and not loaded.error else "✗"
             item.setText(f"{status} {manifest.name} v{manifest.version}")
             item.setData(Qt.ItemDataRole.UserRole, manifest.id)
+            self._plugin_details_html[manifest.id] = self._format_plugin_details(manifest, loaded)
             
             self.plugin_list.addItem(item)
     
-    def _on_plugin_selected(self):
-        """Handle plugin selection in the list."""
-        selected = self.plugin_list.selectedItems()
-        if not selected:
-            self.plugin_details.clear()
-            self.reload_plugin_btn.setEnabled(False)
-            self.enable_plugin_btn.setEnabled(False)
-            return
-        
-        plugin_id = selected[0].data(Qt.ItemDataRole.UserRole)
-        loaded = self.plugin_manager.get_plugin(plugin_id) if self.plugin_manager else None
-        
+    @staticmethod
+    def _format_plugin_details(manifest, loaded):
+        """Build the details pane HTML for a discovered plugin."""
         if loaded:
             manifest = loaded.manifest
             status = "Enabled" if loaded.enabled else "Disabled"
             if loaded.error:
                 status = f"Error: {loaded.error}"
-            
-            details = (
+            return (
                 f"<b>{manifest.name}</b> v{manifest.version}<br>"
                 f"<i>{manifest.description}</i><br><br>"
                 f"Author: {manifest.author or 'Unknown'}<br>"
                 f"Status: {status}<br>"
                 f"Path: {loaded.path}"
             )
-            self.plugin_details.setHtml(details)
-            self.reload_plugin_btn.setEnabled(True)
-            self.enable_plugin_btn.setEnabled(True)
-            self.enable_plugin_btn.setText("Disable" if loaded.enabled else "Enable")
-        else:
-            # Plugin discovered but not loaded
-            for manifest in self.plugin_manager.discover_plugins():
-                if manifest.id == plugin_id:
-                    details = (
-                        f"<b>{manifest.name}</b> v{manifest.version}<br>"
-                        f"<i>{manifest.description}</i><br><br>"
-                        f"Author: {manifest.author or 'Unknown'}<br>"
-                        f"Status: Not loaded"
-                    )
-                    self.plugin_details.setHtml(details)
-                    self.reload_plugin_btn.setEnabled(True)
-                    self.enable_plugin_btn.setEnabled(True)
-                    self.enable_plugin_btn.setText("Enable")
+        return (
+            f"<b>{manifest.name}</b> v{manifest.version}<br>"
+            f"<i>{manifest.description}</i><br><br>"
+            f"Author: {manifest.author or 'Unknown'}<br>"
+            f"Status: Not loaded"
+        )
+    
+    def _reselect_plugin(self, plugin_id):
+        """Re-select a plugin row after repopulating, refreshing details once."""
+        with QSignalBlocker(self.plugin_list):
+            for i in range(self.plugin_list.count()):
+                item = self.plugin_list.item(i)
+                if item.data(Qt.ItemDataRole.UserRole) == plugin_id:
+                    item.setSelected(True)
                     break
+        self._on_plugin_selected()
+    
+    def _on_plugin_selected(self):
+        """Handle plugin selection in the list."""
+        selected = self.plugin_list.selectedItems()
+        if not selected:
+            self.plugin_details.clear()
+            self.reload_plugin_btn.setEnabled(False)
+            self.enable_plugin_btn.setEnabled(False)
+            return
+        
+        plugin_id = selected[0].data(Qt.ItemDataRole.UserRole)
+        details = self._plugin_details_html.get(plugin_id)
+        if details is None:
+            return
+        loaded = self.plugin_manager.get_plugin(plugin_id) if self.plugin_manager else None
+        
+        self.plugin_details.setHtml(details)
+        self.reload_plugin_btn.setEnabled(True)
+        self.enable_plugin_btn.setEnabled(True)
+        self.enable_plugin_btn.setText("Disable" if loaded and loaded.enabled else "Enable")
     
     def _reload_selected_plugin(self):
         """Reload the selected plugin."""
@@ -2420,13 +3239,9 @@ class PreferencesDialog(QDialog):
         
         plugin_id = selected[0].data(Qt.ItemDataRole.UserRole)
         if self.plugin_manager.reload_plugin(plugin_id):
+            self._discovered_cache = None
             self._populate_plugin_list()
-            # Re-select the item
-            for i in range(self.plugin_list.count()):
-                item = self.plugin_list.item(i)
-                if item.data(Qt.ItemDataRole.UserRole) == plugin_id:
-                    item.setSelected(True)
-                    break
+            self._reselect_plugin(plugin_id)
     
     def _toggle_plugin_enabled(self):
         """Enable or disable the selected plugin."""
@@ -2443,18 +3258,12 @@ class PreferencesDialog(QDialog):
             new_state = True  # Enable if not loaded
         
         self.plugin_manager.enable_plugin(plugin_id, new_state)
+        self._discovered_cache = None
         self._populate_plugin_list()
-        
-        # Re-select the item
-        for i in range(self.plugin_list.count()):
-            item = self.plugin_list.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == plugin_id:
-                item.setSelected(True)
-                break
+        self._reselect_plugin(plugin_id)
     
     def _open_plugins_folder(self):
         """Open the user plugins folder in file manager."""
-        import subprocess
         if self.plugin_manager:
             folder = str(self.plugin_manager.user_plugin_dir)
             try:
@@ -2464,7 +3273,6 @@ class PreferencesDialog(QDialog):
     
     def _browse_editor(self):
         """Browse for editor executable."""
-        from PyQt6.QtWidgets import QFileDialog
         path, _ = QFileDialog.getOpenFileName(
             self, "Select Editor", "", "All Files (*)"
         )
@@ -2547,22 +3355,50 @@ class PreferencesDialog(QDialog):
         """Return whether to scale large images."""
         return self.scale_large_checkbox.isChecked()
     
+    def get_export_mode(self):
+        """Return the selected save/export area."""
+        return self.export_mode_combo.currentData()
+    
+    def get_gpu_viewport(self):
+        """Return whether the canvas should use an OpenGL viewport."""
+        return self.gpu_viewport_checkbox.isChecked()
+    
+    def get_log_pastes(self):
+        """Return whether pasted content is copied to pasted_logs/."""
+        return self.log_pastes_checkbox.isChecked()
+    
     def accept(self):
         """Save settings when dialog is accepted."""
         if self.settings:
-            self.settings.setValue("canvas/import_behavior", self.get_import_behavior())
-            self.settings.setValue("canvas/scale_large_images", self.get_scale_large_images())
+            self._set_if_changed("canvas/import_behavior", self.get_import_behavior())
+            self._set_if_changed("canvas/scale_large_images", self.get_scale_large_images())
+            self._set_if_changed("canvas/export_mode", self.get_export_mode())
+            self._set_if_changed("canvas/gpu_viewport", self.get_gpu_viewport())
+            self._set_if_changed("canvas/log_pastes", self.get_log_pastes())
             win_settings = self.get_window_settings()
-            self.settings.setValue("window/startup_mode", win_settings["mode"])
-            self.settings.setValue("window/startup_monitor", win_settings["monitor"])
-            self.settings.setValue("window/startup_state_pref", win_settings["state"])
-            self.settings.setValue("plugins/editor_path", self.get_editor_path())
-            self.settings.setValue("appearance/icon_theme", self.get_icon_theme())
+            self._set_if_changed("window/startup_mode", win_settings["mode"])
+            self._set_if_changed("window/startup_monitor", win_settings["monitor"])
+            self._set_if_changed("window/startup_state_pref", win_settings["state"])
+            self._set_if_changed("plugins/editor_path", self.get_editor_path())
+            self._set_if_changed("appearance/icon_theme", self.get_icon_theme())
+            # No explicit sync: QSettings flushes from the event loop and
+            # MainWindow.closeEvent syncs once on exit
         super().accept()
+    
+    def _set_if_changed(self, key, value):
+        """Write a setting only when it differs from the stored value."""
+        if self.settings.contains(key):
+            value_type = type(value) if isinstance(value, (bool, int, float, str)) else None
+            if value_type is None:
+                stored = self.settings.value(key)
+            else:
+                stored = self.settings.value(key, type=value_type)
+            if stored == value:
+                return
+        self.settings.setValue(key, value)
 
 
 class MainWindow(QMainWindow):
-
     def get_icon_resource(self, name):
         """
         Get an icon by name, respecting theme settings and prioritizing SVG.
@@ -2592,74 +3428,76 @@ class MainWindow(QMainWindow):
         }
         resolved_name = icon_aliases.get(name, name)
 
-        # Theme support
-        theme = self.settings.value("appearance/icon_theme", "default")
-        base_dir = Path(__file__).parent / "assets" / "toolbar_icons"
-        
-        # If using a theme, try that subfolder first
-        if theme != "default":
-            theme_dir = base_dir / theme
-            if theme_dir.exists():
-                # Try SVG (prioritized as per user request)
-                svg_path = theme_dir / f"{resolved_name}.svg"
-                if svg_path.exists():
-                    return QIcon(str(svg_path))
-                # Try PNG
-                png_path = theme_dir / f"{resolved_name}.png"
-                if png_path.exists():
-                    return QIcon(str(png_path))
-        
-        # Fallback to default assets
-        # Try SVG first
-        svg_path = base_dir / f"{resolved_name}.svg"
-        if svg_path.exists():
-            return QIcon(str(svg_path))
-        
-        # Try PNG
-        png_path = base_dir / f"{resolved_name}.png"
-        if png_path.exists():
-            return QIcon(str(png_path))
+        if self._icon_cache is None:
+            self._icon_cache = self._build_icon_cache()
+        icon = self._icon_cache.get(resolved_name)
+        if isinstance(icon, str):
+            # Resolved path only; decode on first request
+            icon = self._icon_cache[resolved_name] = _toolbar_icon(icon)
+        if icon is not None:
+            return icon
             
         # Placeholder generation
         return self._create_placeholder_icon(name)
 
+    def _build_icon_cache(self):
+        """
+        Resolve every toolbar icon once with a single directory read per folder.
+        Active theme beats default assets, and SVG beats PNG within a folder.
+        """
+        theme = self.settings.value("appearance/icon_theme", "default")
+        base_dir = self._icon_base_dir
+        search_dirs = [base_dir]
+        if theme != "default":
+            search_dirs.append(base_dir / theme)
+        
+        paths = {}
+        # Lowest priority first so the theme folder overrides default assets
+        for directory in search_dirs:
+            found = {}
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        stem, ext = os.path.splitext(entry.name)
+                        if ext not in ('.svg', '.png') or not entry.is_file():
+                            continue
+                        if ext == '.svg' or stem not in found:
+                            found[stem] = entry.path
+            except OSError:
+                continue
+            paths.update(found)
+        return paths
+
+    def _invalidate_icon_cache(self):
+        self._icon_cache = None
+
     def _create_placeholder_icon(self, text):
         """Generate a placeholder icon with the filename/text."""
-        size = 48
-        pixmap = QPixmap(size, size)
-        pixmap.fill(QColor("transparent"))
-        painter = QPainter(pixmap)
-        
-        # Draw dashed border
-        pen = QPen(QColor(255, 0, 0, 128))
-        pen.setWidth(1)
-        pen.setStyle(Qt.PenStyle.DashLine)
-        painter.setPen(pen)
-        painter.drawRect(0, 0, size-1, size-1)
-        
-        # Draw text
-        painter.setPen(QColor("red"))
-        font = painter.font()
-        font.setPixelSize(8)
-        painter.setFont(font)
-        
-        # If user text is "toolbar_icon_crop", just show "crop"
-        display_text = text.replace("toolbar_icon_", "")
-        painter.drawText(QRectF(0, 0, size, size), Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, display_text)
-        
-        painter.end()
-        return QIcon(pixmap)
+        icon = _placeholder_icon_cache.get(text)
+        if icon is None:
+            # If user text is "toolbar_icon_crop", just show "crop"
+            label = html.escape(text.replace("toolbar_icon_", ""))
+            data = PLACEHOLDER_SVG_TEMPLATE.format(label=label).encode()
+            icon = QIcon(QPixmap.fromImage(QImage.fromData(data, "SVG")))
+            _placeholder_icon_cache[text] = icon
+        return icon
 
     def __init__(self):
         super().__init__()
 
+        self._icon_base_dir = Path(__file__).parent / "assets" / "toolbar_icons"
+        self._icon_cache = None  # icon name -> path, swapped for a QIcon on first lookup
+        self._cached_screens = None  # refreshed when monitors are plugged/unplugged
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._invalidate_screens)
+        app.screenRemoved.connect(self._invalidate_screens)
 
         self.setWindowTitle("CanvasForge")
         app_icon_path = Path(__file__).parent / "assets" / "app_icons" / "canvasForge_app_icon.png"
         if app_icon_path.exists():
             self.setWindowIcon(QIcon(str(app_icon_path)))
         self.fill_mode = FillMode.TRANSPARENT
-        self.settings = QSettings("CanvasForge", "CanvasForge")
+        self.settings = CachedSettings(QSettings("CanvasForge", "CanvasForge"))
         self._restore_window_geometry()
         default_pictures = Path.home() / "Pictures" / "CanvasForge"
         saved_dir = self.settings.value("default_save_dir", str(default_pictures))
@@ -2675,12 +3513,26 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self._splitter)
 
         self.scene = QGraphicsScene()
+        # Rubber-band and drag selection emit selectionChanged in bursts;
+        # mirror it into the layer list at most once per frame
+        self._layer_selection_timer = QTimer(self)
+        self._layer_selection_timer.setSingleShot(True)
+        self._layer_selection_timer.setInterval(8)
+        self._layer_selection_timer.timeout.connect(self._sync_layer_selection)
         self.scene.selectionChanged.connect(self.on_scene_selection_changed)
+        # Last full-scene capture, reused by save/export until an edit marks
+        # the scene dirty
+        self._composite_cache = None
+        self._composite_rect = None
+        self._pending_writes = set()  # target paths still being encoded
+        self._write_relay = _ImageWriteRelay(QApplication.instance())
+        self._write_relay.written.connect(self._on_image_written)
 
         self.artifact_list = ArtifactList()
         self.view = CanvasView(self.scene, self.artifact_list, self)
         self.view.cursorMoved.connect(self.update_cursor_status)
         self.view.itemAdded.connect(self.add_item_to_canvas)
+        self.view.itemsAdded.connect(self.add_items_to_canvas)
 
         right_widget = QWidget()
         right_layout = QVBoxLayout(right_widget)
@@ -2709,7 +3561,7 @@ class MainWindow(QMainWindow):
 
         # Create wrapping toolbar
         self.toolbar = WrappingToolBar(self)
-        self.toolbar.setIconSize(QSizeF(48, 48).toSize())
+        self.toolbar.setIconSize(QSize(TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE))
         self.toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
         
         # Create a dock widget for the toolbar so it can wrap
@@ -2721,6 +3573,8 @@ class MainWindow(QMainWindow):
         
         # Store action definitions for toolbar customization
         self._toolbar_action_defs = {}
+        self._toolbar_action_fast = {}
+        self._toolbar_build_suspended = False
         self._setup_toolbar_actions()
         
         # Build toolbar from saved order or default
@@ -2782,9 +3636,19 @@ class MainWindow(QMainWindow):
         self.undo_manager.redoDescriptionChanged.connect(
             lambda desc: self.redo_action.setText(f"Redo {desc}" if desc else "Redo")
         )
+        self.undo_manager.stackChanged.connect(self._invalidate_composite)
         
-        # Load plugins after UI is set up
-        self.plugin_manager.load_all_plugins()
+        # Load plugins once the event loop runs so the window paints first
+        QTimer.singleShot(0, self._load_plugins)
+
+    def _load_plugins(self):
+        """Load all plugins, rebuilding the toolbar once afterwards."""
+        self._toolbar_build_suspended = True
+        try:
+            self.plugin_manager.load_all_plugins()
+        finally:
+            self._toolbar_build_suspended = False
+        self._build_toolbar()
 
     def _do_undo(self):
         """Perform undo action."""
@@ -2828,11 +3692,11 @@ class MainWindow(QMainWindow):
         for action_id, icon_name, text, callback, shortcut, is_core in core_actions:
             if action_id.startswith("---"):
                 # This is a separator marker
-                self._toolbar_action_defs[action_id] = {
+                self._store_toolbar_action_def(action_id, {
                     "id": action_id,
                     "is_separator": True,
                     "is_core": True,
-                }
+                })
             else:
                 action = QAction(self.get_icon_resource(icon_name), text, self)
                 if shortcut:
@@ -2840,14 +3704,14 @@ class MainWindow(QMainWindow):
                 if callback:
                     action.triggered.connect(callback)
                 
-                self._toolbar_action_defs[action_id] = {
+                self._store_toolbar_action_def(action_id, {
                     "id": action_id,
                     "action": action,
                     "icon_name": icon_name,
                     "text": text,
                     "is_separator": False,
                     "is_core": is_core,
-                }
+                })
         
         # Set delete action shortcut
         if "delete" in self._toolbar_action_defs:
@@ -2855,6 +3719,17 @@ class MainWindow(QMainWindow):
                 QKeySequence(QKeySequence.StandardKey.Delete)
             )
     
+    def _store_toolbar_action_def(self, action_id, action_def):
+        """Store an action definition and its flattened ActionRow."""
+        self._toolbar_action_defs[action_id] = action_def
+        self._toolbar_action_fast[action_id] = ActionRow(
+            action_def.get("is_separator", False),
+            action_def.get("is_core", False),
+            action_def.get("text", action_id),
+            action_def.get("icon_name", ""),
+            action_def.get("action"),
+        )
+    
     def _get_toolbar_order(self):
         """Get the toolbar order from settings or return default."""
         saved_order = self.settings.value("toolbar/order", None)
@@ -2870,25 +3745,25 @@ class MainWindow(QMainWindow):
         
         order = self._get_toolbar_order()
         
+        rows = self._toolbar_action_fast
+        
         # Add actions in order
         for action_id in order:
-            if action_id not in self._toolbar_action_defs:
+            row = rows.get(action_id)
+            if row is None:
                 continue
             
-            action_def = self._toolbar_action_defs[action_id]
-            if action_def.get("is_separator"):
+            is_sep, _, _, _, action = row
+            if is_sep:
                 self.toolbar.addSeparator()
-            else:
-                action = action_def.get("action")
-                if action:
-                    self.toolbar.addAction(action)
+            elif action:
+                self.toolbar.addAction(action)
         
         # Add any plugin actions that aren't in the saved order
-        for action_id, action_def in self._toolbar_action_defs.items():
-            if action_id not in order and not action_def.get("is_separator"):
-                action = action_def.get("action")
-                if action:
-                    self.toolbar.addAction(action)
+        order_set = set(order)
+        for action_id, (is_sep, _, _, _, action) in rows.items():
+            if action_id not in order_set and not is_sep and action:
+                self.toolbar.addAction(action)
     
     def save_toolbar_order(self, order):
         """Save the toolbar order to settings and rebuild toolbar."""
@@ -2897,20 +3772,44 @@ class MainWindow(QMainWindow):
     
     def register_plugin_toolbar_action(self, action_id, action, icon_name=None):
         """Register a plugin action for the toolbar."""
-        self._toolbar_action_defs[action_id] = {
+        self._store_toolbar_action_def(action_id, {
             "id": action_id,
             "action": action,
             "icon_name": icon_name,
             "text": action.text(),
             "is_separator": False,
             "is_core": False,  # Plugin actions are not core
-        }
+        })
         # Add to toolbar (will be at end unless order includes it)
-        self._build_toolbar()
+        if not self._toolbar_build_suspended:
+            self._build_toolbar()
+
+    def unregister_plugin_toolbar_actions(self, action_ids):
+        """Drop plugin toolbar actions, rebuilding the toolbar once."""
+        for action_id in action_ids:
+            self._toolbar_action_defs.pop(action_id, None)
+            self._toolbar_action_fast.pop(action_id, None)
+        if not self._toolbar_build_suspended:
+            self._build_toolbar()
+
+    def update_action_icon(self, action_id, icon_path):
+        """Swap the icon of a single toolbar action in place."""
+        action_def = self._toolbar_action_defs.get(action_id)
+        action = action_def.get("action") if action_def else None
+        if action:
+            action.setIcon(_toolbar_icon(str(icon_path)))
+
+    def _refresh_toolbar_icons(self):
+        """Re-icon the live toolbar actions from the current icon theme."""
+        for is_sep, is_core, _, icon_name, action in self._toolbar_action_fast.values():
+            # Plugin actions resolve through their own API's priority order
+            if is_core and not is_sep and action and icon_name:
+                action.setIcon(self.get_icon_resource(icon_name))
+        self.plugin_manager.refresh_toolbar_icons()
 
     def open_preferences(self):
         """Open the Preferences dialog."""
-        current_library_dir = self.library_panel.current_root_path() if hasattr(self, 'library_panel') else None
+        current_library_dir = self.library_panel.current_root_path()
         dialog = PreferencesDialog(
             self,
             settings=self.settings,
@@ -2918,7 +3817,12 @@ class MainWindow(QMainWindow):
             current_library_dir=current_library_dir,
             plugin_manager=self.plugin_manager
         )
+        previous_theme = self.settings.value("appearance/icon_theme", "default")
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            if self.settings.value("appearance/icon_theme", "default") != previous_theme:
+                self._invalidate_icon_cache()
+                self._refresh_toolbar_icons()
+            
             # Apply save folder change
             new_save = dialog.get_save_folder()
             if new_save:
@@ -2929,7 +3833,7 @@ class MainWindow(QMainWindow):
             
             # Apply library folder change
             new_library = dialog.get_library_folder()
-            if new_library and hasattr(self, 'library_panel'):
+            if new_library:
                 self.library_panel.set_root_path(new_library, persist=True)
                 self._status_bar.showMessage(f"Screenshot folder set to {new_library}", 5000)
             
@@ -2959,32 +3863,51 @@ class MainWindow(QMainWindow):
             svg_data = mime_data.data('image/svg+xml')
             renderer = QSvgRenderer(svg_data)
             item = VectorItem(renderer)
-            thumb = QPixmap(50, 50)
-            thumb.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(thumb)
-            renderer.render(painter)
-            painter.end()
-            self.add_to_repository(item, thumbnail_pixmap=thumb)
+            self.add_to_repository(item, thumbnail_pixmap=self._render_svg_thumbnail(renderer))
 
     def add_artifact(self, file_path):
         reader = QImageReader(file_path)
         if reader.canRead():
-            pixmap = QPixmap(file_path)
-            item = RasterItem(pixmap)
-            self.add_to_repository(item, thumbnail_source=file_path)
+            # Only the thumbnail is needed now; the full image is decoded on drop
+            self.add_to_repository(LazyRasterItem(file_path), thumbnail_source=file_path)
         else:
             renderer = QSvgRenderer(file_path)
             if renderer.isValid():
                 item = VectorItem(renderer)
-                self.add_to_repository(item, thumbnail_source=file_path)
+                self.add_to_repository(item, thumbnail_pixmap=self._render_svg_thumbnail(renderer))
+
+    @staticmethod
+    def _render_svg_thumbnail(renderer):
+        thumb = QPixmap(REPOSITORY_THUMB_SIZE, REPOSITORY_THUMB_SIZE)
+        thumb.fill(Qt.GlobalColor.transparent)
+        # Fit the drawing inside the square, centred, rather than stretching it
+        size = QSizeF(renderer.defaultSize()).scaled(
+            REPOSITORY_THUMB_SIZE, REPOSITORY_THUMB_SIZE, Qt.AspectRatioMode.KeepAspectRatio
+        )
+        target = QRectF(QPointF(), size)
+        target.moveCenter(QRectF(thumb.rect()).center())
+        painter = QPainter(thumb)
+        renderer.render(painter, target)
+        painter.end()
+        return thumb
+
+    @staticmethod
+    def _read_thumbnail(file_path):
+        """Decode an image file straight at thumbnail size."""
+        reader = QImageReader(str(file_path))
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(REPOSITORY_THUMB_SIZE, REPOSITORY_THUMB_SIZE,
+                                             Qt.AspectRatioMode.KeepAspectRatio))
+        return QPixmap.fromImage(reader.read())
 
     def add_to_repository(self, item, thumbnail_source=None, thumbnail_pixmap=None):
         list_item = QListWidgetItem()
         pixmap = None
         if thumbnail_pixmap:
-            pixmap = thumbnail_pixmap.scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio)
+            pixmap = _make_thumb(thumbnail_pixmap)
         elif thumbnail_source:
-            pixmap = QPixmap(thumbnail_source).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio)
+            pixmap = self._read_thumbnail(thumbnail_source)
         if pixmap:
             list_item.setIcon(QIcon(pixmap))
         list_item.setText(f"Item {self.artifact_list.count() + 1}")
@@ -2992,75 +3915,79 @@ class MainWindow(QMainWindow):
         self.artifact_list.addItem(list_item)
 
     def add_item_to_canvas(self, item):
-        if item.scene() != self.scene:
-            self.scene.addItem(item)
-        layer_item = QListWidgetItem()
-        name = "Layer"
-        if isinstance(item, QGraphicsRectItem):
-            name = "Rectangle"
-        elif isinstance(item, QGraphicsEllipseItem):
-            name = "Ellipse"
-        elif isinstance(item, RasterItem):
-            name = "Image"
-        elif isinstance(item, VectorItem):
-            name = "Vector"
-        elif isinstance(item, QGraphicsTextItem):
-            name = "Text"
-        layer_item.setText(f"{name} {self.layer_list.count() + 1}")
-        layer_item.setData(Qt.ItemDataRole.UserRole, item)
-        self.layer_list.insertItem(0, layer_item)
-        self.layer_list.update_z_orders()
+        self.add_items_to_canvas([item])
+
+    @staticmethod
+    def _layer_name(item):
+        return _dispatch_by_type(_layer_name_dispatch, _LAYER_NAME_LADDER, item, "Layer")
+
+    def add_items_to_canvas(self, items):
+        """Add items as new top layers, leaving exactly those items selected."""
+        if not items:
+            return
         # Block signals to prevent cascading selection updates
-        self.scene.blockSignals(True)
-        self.layer_list.blockSignals(True)
-        # Clear all selections
-        self.scene.clearSelection()
-        self.layer_list.clearSelection()
-        # Select only the new item
-        item.setSelected(True)
-        layer_item.setSelected(True)
-        self.layer_list.setCurrentItem(layer_item)
-        # Restore signals
-        self.layer_list.blockSignals(False)
-        self.scene.blockSignals(False)
-        
-        # Apply import behavior from settings
+        with QSignalBlocker(self.scene), QSignalBlocker(self.layer_list):
+            # Clear all selections
+            self.scene.clearSelection()
+            self.layer_list.clearSelection()
+            layer_item = None
+            for item in items:
+                if item.scene() != self.scene:
+                    self.scene.addItem(item)
+                layer_item = QListWidgetItem()
+                layer_item.setText(f"{self._layer_name(item)} {self.layer_list.count() + 1}")
+                layer_item.setData(Qt.ItemDataRole.UserRole, item)
+                self.layer_list.add_layer(layer_item)
+                # Select only the new items
+                item.setSelected(True)
+                layer_item.setSelected(True)
+            self.layer_list.update_top_z_orders(len(items))
+            self.layer_list.setCurrentItem(layer_item)
+        
+        # Apply import behavior from settings, once for the whole batch
+        last = items[-1]
         behavior = self.settings.value("canvas/import_behavior", "keep")
         if behavior == "pan_to_new":
-            self.view.pan_to_item(item)
+            self.view.pan_to_item(last)
         elif behavior == "fit_all":
             self.view.fit_all_items()
         elif behavior == "fit_new":
-            self.view.fit_item(item)
+            self.view.fit_item(last)
         # "keep" = do nothing (default)
+        self._invalidate_composite()
 
     def on_layer_selection_changed(self):
-        self.scene.blockSignals(True)
-        self.scene.clearSelection()
-        for item in self.layer_list.selectedItems():
-            graphics_item = item.data(Qt.ItemDataRole.UserRole)
-            # Check if C++ object is still valid
-            if graphics_item and not sip.isdeleted(graphics_item):
-                graphics_item.setSelected(True)
-        self.scene.blockSignals(False)
+        with QSignalBlocker(self.scene):
+            self.scene.clearSelection()
+            for item in self.layer_list.selectedItems():
+                graphics_item = item.data(Qt.ItemDataRole.UserRole)
+                # Check if C++ object is still valid
+                if graphics_item and not sip.isdeleted(graphics_item):
+                    graphics_item.setSelected(True)
 
     def on_scene_selection_changed(self):
-        self.layer_list.blockSignals(True)
-        self.layer_list.clearSelection()
-        try:
-            selected_items = self.scene.selectedItems()
-            if selected_items:
-                for i in range(self.layer_list.count()):
-                    list_item = self.layer_list.item(i)
-                    graphics_item = list_item.data(Qt.ItemDataRole.UserRole)
-                    # Check if C++ object is still valid
-                    if graphics_item and not sip.isdeleted(graphics_item):
-                        if graphics_item in selected_items:
-                            list_item.setSelected(True)
-        except RuntimeError:
-            # Handle case where scene or items are deleted
-            pass
-        self.layer_list.blockSignals(False)
+        # Throttle rather than debounce: restarting a running timer would keep
+        # pushing the sync back for as long as the burst lasts
+        timer = self._layer_selection_timer
+        if not sip.isdeleted(timer) and not timer.isActive():
+            timer.start()
+
+    def _flush_layer_selection(self):
+        """Apply a pending scene -> layer list selection sync immediately."""
+        if self._layer_selection_timer.isActive():
+            self._layer_selection_timer.stop()
+            self._sync_layer_selection()
+
+    def _sync_layer_selection(self):
+        # May fire once more while the scene is torn down on exit
+        if sip.isdeleted(self.scene) or sip.isdeleted(self.layer_list):
+            return
+        with QSignalBlocker(self.layer_list):
+            self.layer_list.clearSelection()
+            for graphics_item in self.scene.selectedItems():
+                list_item = self.layer_list.list_item_for(graphics_item)
+                if list_item is not None:
+                    list_item.setSelected(True)
 
     def flatten_selected(self):
         items = self._selected_layer_items()
@@ -3074,108 +4001,149 @@ class MainWindow(QMainWindow):
         self._remove_items(items_to_delete)
 
     def _selected_layer_items(self):
-        layer_items = self.layer_list.graphics_items()
-        if not layer_items:
+        # The layer list selection is merged below, so it must be current
+        self._flush_layer_selection()
+        layer_set = self.layer_list.graphics_items_set()
+        if not layer_set:
             return []
-        layer_set = set(layer_items)
+        # QGraphicsScene keeps its selection as a set, so selectedItems() is
+        # proportional to the selection, not the scene
         items = [item for item in self.scene.selectedItems() if item in layer_set]
+        seen = set(items)
         for list_item in self.layer_list.selectedItems():
             graphics_item = list_item.data(Qt.ItemDataRole.UserRole)
-            if graphics_item and graphics_item in layer_set and graphics_item not in items:
+            if graphics_item and graphics_item in layer_set and graphics_item not in seen:
+                seen.add(graphics_item)
                 items.append(graphics_item)
         return items
 
+    @staticmethod
+    def _paint_layers(painter, items):
+        """Paint items bottom-first in scene coordinates, without selection decorations."""
+        option = QStyleOptionGraphicsItem()
+        for item in items:
+            painter.save()
+            painter.setTransform(item.sceneTransform(), True)
+            painter.setOpacity(item.effectiveOpacity())
+            item.paint(painter, option, None)
+            painter.restore()
+
     def _flatten_items(self, items):
-        layer_items = self.layer_list.graphics_items()
-        items = [item for item in items if item in layer_items]
+        layer_set = self.layer_list.graphics_items_set()
+        items = [item for item in items if item in layer_set]
         if len(items) < 1:
             self._status_bar.showMessage("Select at least one item to flatten", 4000)
             return
-        bounding = QRectF()
-        for idx, item in enumerate(items):
-            if idx == 0:
-                bounding = item.sceneBoundingRect()
-            else:
-                bounding = bounding.united(item.sceneBoundingRect())
+        bounding = functools.reduce(QRectF.united, (item.sceneBoundingRect() for item in items))
         if bounding.isEmpty():
             return
         size = bounding.size().toSize()
         if size.isEmpty():
             return
-        scene = self.scene
-        others_hidden = []
-        for scene_item in scene.items():
-            if scene_item not in items and scene_item.isVisible():
-                scene_item.setVisible(False)
-                others_hidden.append(scene_item)
-        image = QImage(size, QImage.Format.Format_ARGB32)
+        # Paint only the chosen items, bottom layer first, instead of hiding
+        # the rest of the scene around a full scene.render()
+        selected = set(items)
+        ordered = [item for item in reversed(self.layer_list.graphics_items()) if item in selected]
+        # Premultiplied is the raster engine's native blend format
+        image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
         image.fill(Qt.GlobalColor.transparent)
         painter = QPainter(image)
-        scene.render(painter, QRectF(image.rect()), bounding)
+        painter.translate(-bounding.topLeft())
+        self._paint_layers(painter, [item for item in ordered if item.isVisible()])
         painter.end()
-        for hidden in others_hidden:
-            hidden.setVisible(True)
         new_item = RasterItem(QPixmap.fromImage(image))
         new_item.setPos(bounding.topLeft())
         self.view.itemAdded.emit(new_item)
         self._remove_items(items, clear_selection=False)
         self.scene.clearSelection()
         new_item.setSelected(True)
+        self._invalidate_composite()
         self._status_bar.showMessage("Flattened items into a single layer", 4000)
 
     def _remove_items(self, items, clear_selection=True):
         if not items:
             return
         # Block signals to prevent selection handlers from accessing deleted items
-        self.scene.blockSignals(True)
-        self.layer_list.blockSignals(True)
-        for graphics_item in items:
-            if hasattr(graphics_item, 'clearSelectionOverlay'):
-                graphics_item.clearSelectionOverlay()
-            handles = getattr(graphics_item, 'handles', None)
-            if handles:
-                handles.cleanup()
-                graphics_item.handles = None
-            if graphics_item.scene() is self.scene:
-                self.scene.removeItem(graphics_item)
-        self.layer_list.remove_graphics_items(items)
-        # Restore signals before clearing selection
-        self.layer_list.blockSignals(False)
-        self.scene.blockSignals(False)
-        if clear_selection:
-            self.scene.clearSelection()
-            self.layer_list.clearSelection()
-        self.view.handle_items_deleted(items)
+        with QSignalBlocker(self.scene), QSignalBlocker(self.layer_list):
+            for graphics_item in items:
+                if hasattr(graphics_item, 'clearSelectionOverlay'):
+                    graphics_item.clearSelectionOverlay()
+                handles = getattr(graphics_item, 'handles', None)
+                if handles:
+                    handles.cleanup()
+                    graphics_item.handles = None
+                if graphics_item.scene() is self.scene:
+                    self.scene.removeItem(graphics_item)
+            self.layer_list.remove_graphics_items(items)
+            if clear_selection:
+                # Both sides are cleared here, so neither needs to mirror the other
+                self.scene.clearSelection()
+                self.layer_list.clearSelection()
+        self.view.handle_items_deleted(set(items))
+        self._invalidate_composite()
         self.scene.update()
 
     def save_canvas(self):
-        print(f"DEBUG save_canvas: default_save_dir = {self.default_save_dir}")
+        log.debug("save_canvas: default_save_dir = %s", self.default_save_dir)
         image = self._capture_scene_image()
         if image is None:
-            print("DEBUG save_canvas: No image to save (scene empty)")
+            log.debug("save_canvas: no image to save (scene empty)")
             self._status_bar.showMessage("Nothing to save", 4000)
             return
         self._ensure_save_directory()
-        print(f"DEBUG save_canvas: Directory exists = {self.default_save_dir.exists()}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("save_canvas: directory exists = %s", self.default_save_dir.exists())
         base_name = datetime.date.today().strftime("%Y-%m-%d") + "_CanvasForge"
-        counter = 1
-        while True:
-            candidate = self.default_save_dir / f"{base_name}_{counter}.png"
-            if not candidate.exists():
-                break
-            counter += 1
-        print(f"DEBUG save_canvas: Attempting to save to {candidate}")
-        success = image.save(str(candidate))
-        print(f"DEBUG save_canvas: Save result = {success}")
-        if success:
-            self._status_bar.showMessage(f"Saved canvas to {candidate}", 5000)
-        else:
-            self._status_bar.showMessage(f"ERROR: Failed to save to {candidate}", 5000)
-            print(f"ERROR save_canvas: image.save() returned False for {candidate}")
+        # One directory listing instead of an exists() call per taken index;
+        # names an earlier save is still writing count as taken too
+        prefix = f"{base_name}_"
+        taken = [Path(path).stem for path in self._pending_writes]
+        taken.extend(path.stem for path in self.default_save_dir.glob(f"{prefix}*.png"))
+        used = {int(stem[len(prefix):]) for stem in taken
+                if stem.startswith(prefix) and stem[len(prefix):].isdecimal()}
+        candidate = self.default_save_dir / f"{prefix}{max(used, default=0) + 1}.png"
+        log.debug("save_canvas: attempting to save to %s", candidate)
+        self._write_image_async(image, str(candidate), "save")
+
+    def _write_image_async(self, pixmap, path, kind):
+        """Encode and write a capture on the thread pool; see _on_image_written."""
+        # QPixmap is GUI-thread only; the QImage copy can be saved anywhere
+        image = pixmap.toImage()
+        self._pending_writes.add(path)
+        # Emit through the relay, never self: the window may be torn down
+        # while the pool is still writing
+        relay = self._write_relay
+        QThreadPool.globalInstance().start(
+            lambda: relay.written.emit(kind, path, image.save(path))
+        )
+
+    def _on_image_written(self, kind, path, ok):
+        self._pending_writes.discard(path)
+        if kind == "save":
+            log.debug("save_canvas: save result = %s", ok)
+            if ok:
+                self._status_bar.showMessage(f"Saved canvas to {path}", 5000)
+            else:
+                self._status_bar.showMessage(f"ERROR: Failed to save to {path}", 5000)
+                log.error("save_canvas: image.save() returned False for %s", path)
+        elif kind == "export":
+            if ok:
+                self._status_bar.showMessage(f"Exported canvas to {path}", 5000)
+                self.library_panel.refresh()
+            else:
+                self._status_bar.showMessage(f"ERROR: Failed to export to {path}", 5000)
 
     def _ensure_save_directory(self):
         self.default_save_dir.mkdir(parents=True, exist_ok=True)
 
+    def _screens(self):
+        if self._cached_screens is None:
+            self._cached_screens = QGuiApplication.screens()
+        return self._cached_screens
+
+    def _invalidate_screens(self, *_):
+        self._cached_screens = None
+
     def _restore_window_geometry(self):
         """Restore window position and size based on startup preference."""
         startup_mode = self.settings.value("window/startup_mode", "last")
@@ -3194,7 +4162,7 @@ class MainWindow(QMainWindow):
         
         elif startup_mode == "monitor":
             monitor_idx = self.settings.value("window/startup_monitor", 0, type=int)
-            screens = QApplication.screens()
+            screens = self._screens()
             if 0 <= monitor_idx < len(screens):
                 screen = screens[monitor_idx]
                 # Center on this screen
@@ -3228,13 +4196,11 @@ class MainWindow(QMainWindow):
     
     def _ensure_window_visible(self):
         """Ensure the window is visible on a connected screen."""
-        from PyQt6.QtGui import QGuiApplication
-        
         window_rect = self.frameGeometry()
         window_center = window_rect.center()
         
         # Check if window center is on any available screen
-        for screen in QGuiApplication.screens():
+        for screen in self._screens():
             if screen.availableGeometry().contains(window_center):
                 return  # Window is visible
         
@@ -3247,15 +4213,6 @@ class MainWindow(QMainWindow):
             new_y = avail.y() + (avail.height() - window_rect.height()) // 2
             self.move(new_x, new_y)
 
-    def _restore_selection_state(self, selected_items, overlay_item, overlay_state):
-        if overlay_item and overlay_state:
-            overlay_item.setVisible(overlay_state["visible"])
-            if overlay_state["selected"]:
-                overlay_item.setSelected(True)
-        for item in selected_items:
-            if item.scene() is self.scene:
-                item.setSelected(True)
-
     def adjust_layer_z(self, delta):
         row = self.layer_list.currentRow()
         if row == -1:
@@ -3272,7 +4229,9 @@ class MainWindow(QMainWindow):
         if pos is None:
             self._status_bar.clearMessage()
             return
-        self._status_bar.showMessage(f"Cursor: x={pos.x():.1f}, y={pos.y():.1f}")
+        text = f"Cursor: x={pos.x():.1f}, y={pos.y():.1f}"
+        if text != self._status_bar.currentMessage():
+            self._status_bar.showMessage(text)
 
     def _restore_splitter_sizes(self):
         default_sizes = [220, 760, 240]
@@ -3293,7 +4252,7 @@ class MainWindow(QMainWindow):
         scene_pos = self.view.mapToScene(self.view.viewport().rect().center())
         if not self.view._paste_file_path(file_path, scene_pos):
             self.add_artifact(file_path)
-        self._status_bar.showMessage(f"Imported {Path(file_path).name} from library", 4000)
+        self._status_bar.showMessage(f"Imported {os.path.basename(file_path)} from library", 4000)
 
     def _export_canvas_to_library(self):
         if not hasattr(self, 'library_panel'):
@@ -3307,44 +4266,50 @@ class MainWindow(QMainWindow):
             self._status_bar.showMessage("Nothing to export", 4000)
             return
         target_dir.mkdir(parents=True, exist_ok=True)
-        file_name = f"canvas_export_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        file_name = datetime.datetime.now().strftime(EXPORT_FILE_NAME_FORMAT)
         export_path = target_dir / file_name
-        image.save(str(export_path))
-        self._status_bar.showMessage(f"Exported canvas to {export_path}", 5000)
-        self.library_panel.refresh()
+        self._write_image_async(image, str(export_path), "export")
 
     def _on_library_folder_changed(self, folder):
         self._status_bar.showMessage(f"Library folder: {folder}", 3000)
 
+    def _invalidate_composite(self, *_):
+        self.scene.setProperty("compositeDirty", True)
+
     def _capture_scene_image(self):
-        selected_items = list(self.scene.selectedItems())
-        overlay_item = None
-        overlay_state = None
-        overlay_host = self.view.active_selection_host()
-        if overlay_host and overlay_host.hasSelectionOverlay():
-            overlay_item = overlay_host.selectionOverlay()
-            if overlay_item:
-                overlay_state = {
-                    "visible": overlay_item.isVisible(),
-                    "selected": overlay_item.isSelected(),
-                }
-                overlay_item.setSelected(False)
-                overlay_item.setVisible(False)
-        self.scene.clearSelection()
-        rect = self.scene.itemsBoundingRect()
-        if rect.isEmpty():
+        viewport_rect = None
+        if self.settings.value("canvas/export_mode", "all") == "viewport":
+            viewport_rect = self.view.mapToScene(self.view.viewport().rect()).boundingRect()
+        # Items, the undo stack and add/remove paths flag the scene dirty;
+        # viewport captures are also only reused for the same visible rect
+        if self.scene.property("compositeDirty"):
+            self.scene.setProperty("compositeDirty", False)
+            self._composite_cache = None
+        if self._composite_cache is not None and self._composite_rect == viewport_rect:
+            return self._composite_cache
+        # Paint the layers directly rather than scene.render(): selection,
+        # handles and overlays stay untouched and never reach the output
+        items = [item for item in reversed(self.layer_list.graphics_items()) if item.isVisible()]
+        if viewport_rect is not None:
+            rect = viewport_rect
+            items = [item for item in items if item.sceneBoundingRect().intersects(rect)]
+        elif items:
+            rect = functools.reduce(QRectF.united, (item.sceneBoundingRect() for item in items))
+        else:
             rect = QRectF(self.view.viewport().rect())
         size = rect.size().toSize()
         if size.isEmpty():
-            self._restore_selection_state(selected_items, overlay_item, overlay_state)
             return None
-        image = QImage(size, QImage.Format.Format_ARGB32)
-        image.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(image)
-        self.scene.render(painter, QRectF(image.rect()), rect)
+        # Callers only save the result, so render straight into a QPixmap
+        pixmap = QPixmap(size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.translate(-rect.topLeft())
+        self._paint_layers(painter, items)
         painter.end()
-        self._restore_selection_state(selected_items, overlay_item, overlay_state)
-        return image
+        self._composite_cache = pixmap
+        self._composite_rect = viewport_rect
+        return pixmap
 
     def closeEvent(self, event):
         """Save window state before closing."""
@@ -3356,10 +4321,13 @@ class MainWindow(QMainWindow):
         
         # Helper: save current monitor index for reference (optional usage)
         current_screen = self.screen()
-        screens = QApplication.screens()
+        screens = self._screens()
         if current_screen in screens:
             self.settings.setValue("window/last_monitor_index", screens.index(current_screen))
 
+        self.settings.sync()
+        # Let in-flight canvas saves finish writing before the app exits
+        QThreadPool.globalInstance().waitForDone()
         super().closeEvent(event)
 
 
@@ -8,21 +8,67 @@ CanvasForge functionality.
 import os
 import sys
 import json
+import functools
 import importlib
 import importlib.util
 from pathlib import Path
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Callable, TYPE_CHECKING
 from dataclasses import dataclass, field
 
-from PyQt6.QtCore import QObject, pyqtSignal, QSettings
+from PyQt6.QtCore import QObject, pyqtSignal, QSettings, QPointF, QTimer
 from PyQt6.QtWidgets import QMenu
 from PyQt6.QtGui import QIcon, QPixmap, QAction
+from PyQt6 import sip
 
 if TYPE_CHECKING:
     from PyQt6.QtWidgets import QGraphicsScene, QGraphicsItem
     from undo_manager import UndoManager
 
 
+# item type -> has both pixmap() and setPixmap(); probed once per class
+_raster_type_cache: Dict[type, bool] = {}
+
+
+def _is_raster_type(item_type: type) -> bool:
+    is_raster = _raster_type_cache.get(item_type)
+    if is_raster is None:
+        is_raster = hasattr(item_type, 'pixmap') and hasattr(item_type, 'setPixmap')
+        _raster_type_cache[item_type] = is_raster
+    return is_raster
+
+
+# icon file path -> (st_mtime_ns, QIcon); actions showing the same file share
+# one QIcon, and with it one set of rendered pixmaps
+_icon_cache: Dict[str, tuple] = {}
+
+
+def _cached_icon(path: str) -> Optional[QIcon]:
+    """Return a shared QIcon for an icon file, or None if it does not exist."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    cached = _icon_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, QIcon(path))
+        _icon_cache[path] = cached
+    return cached[1]
+
+
+def _make_action(text: str, parent, callback: Callable,
+                 shortcut: Optional[str] = None, icon: Optional[QIcon] = None) -> QAction:
+    """Build a plugin QAction with its icon, shortcut and callback set."""
+    action = QAction(text, parent)
+    if icon is not None:
+        action.setIcon(icon)
+    if shortcut:
+        action.setShortcut(shortcut)
+    action.triggered.connect(callback)
+    return action
+
+
 @dataclass
 class PluginManifest:
     """Plugin metadata from manifest.json"""
@@ -40,6 +86,7 @@ class PluginManifest:
     hooks: Dict[str, str] = field(default_factory=dict)
     toolbar_items: List[Dict[str, str]] = field(default_factory=list)
     menu_items: List[Dict[str, str]] = field(default_factory=list)
+    lazy: bool = False  # import the entry point on first action, not at startup
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PluginManifest':
@@ -58,6 +105,7 @@ class PluginManifest:
             hooks=data.get('hooks', {}),
             toolbar_items=data.get('toolbar_items', []),
             menu_items=data.get('menu_items', []),
+            lazy=bool(data.get('lazy', False)),
         )
 
 
@@ -70,6 +118,7 @@ class LoadedPlugin:
     instance: Any = None
     enabled: bool = True
     error: Optional[str] = None
+    source_mtime: int = 0  # newest .py mtime (ns) in the plugin folder at import
 
 
 class PluginAPI:
@@ -80,15 +129,36 @@ class PluginAPI:
     CanvasForge functionality without direct access to internal objects.
     """
     
-    def __init__(self, main_window, undo_manager: 'UndoManager', plugin_id: str = "unknown"):
+    def __init__(self, main_window, undo_manager: 'UndoManager', plugin_id: str = "unknown",
+                 icon_base_dir: Optional[Path] = None,
+                 theme_listings: Optional[Dict[Path, tuple]] = None):
         self._main_window = main_window
         self._scene = main_window.scene
         self._view = main_window.view
         self._layer_list = main_window.layer_list
         self._undo_manager = undo_manager
-        self._settings = QSettings("CanvasForge", "Plugins")
-        self._registered_actions: List[QAction] = []
+        # plugin id -> QSettings already scoped with beginGroup(plugin id)
+        self._group_settings: Dict[str, QSettings] = {}
+        # (action, QMenu or toolbar it was added to); None when the main
+        # window's plugin toolbar registry owns it under an id
+        self._action_owners: List[tuple] = []
+        self._toolbar_action_ids: List[str] = []
+        # (action, theme resource name, plugin-local icon path) per toolbar
+        # action, so a theme switch can re-resolve the icons
+        self._toolbar_icon_sources: List[tuple] = []
+        # Top-level menu title -> QMenu, filled on first register_menu_action
+        self._menu_index: Dict[str, QMenu] = {}
+        # Items collected inside bulk_add(); None outside of one
+        self._bulk_items: Optional[List[Any]] = None
+        self._update_timer = QTimer()
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._scene.update)
         self._plugin_id = plugin_id
+        # Toolbar icon assets, and theme dir -> (st_mtime_ns, file names)
+        # shared by every plugin's API
+        self._icon_base_dir = icon_base_dir
+        self._theme_listings = theme_listings if theme_listings is not None else {}
     
     # ========================================================================
     # Item Access
@@ -96,7 +166,7 @@ class PluginAPI:
     
     def get_selected_items(self) -> List[Any]:
         """Get all currently selected items."""
-        layer_items = set(self._layer_list.graphics_items())
+        layer_items = self._layer_list.graphics_items_set()
         return [item for item in self._scene.selectedItems() if item in layer_items]
     
     def get_all_items(self) -> List[Any]:
@@ -125,13 +195,13 @@ class PluginAPI:
     
     def get_item_pixmap(self, item) -> Optional[QPixmap]:
         """Get the pixmap from a raster item."""
-        if hasattr(item, 'pixmap'):
+        if _is_raster_type(type(item)):
             return item.pixmap()
         return None
     
     def set_item_pixmap(self, item, pixmap: QPixmap) -> None:
         """Set the pixmap on a raster item."""
-        if hasattr(item, 'setPixmap'):
+        if _is_raster_type(type(item)):
             item.setPixmap(pixmap)
             if hasattr(item, 'updateImageBytes'):
                 item.updateImageBytes()
@@ -143,7 +213,6 @@ class PluginAPI:
     
     def set_item_position(self, item, x: float, y: float) -> None:
         """Set item position."""
-        from PyQt6.QtCore import QPointF
         item.setPos(QPointF(x, y))
     
     def get_item_rotation(self, item) -> float:
@@ -164,7 +233,7 @@ class PluginAPI:
     
     def is_raster_item(self, item) -> bool:
         """Check if item is a raster (pixmap) item."""
-        return hasattr(item, 'pixmap') and hasattr(item, 'setPixmap')
+        return _is_raster_type(type(item))
     
     # ========================================================================
     # Scene Operations
@@ -172,15 +241,33 @@ class PluginAPI:
     
     def add_item(self, item) -> None:
         """Add an item to the canvas."""
-        self._view.itemAdded.emit(item)
+        if self._bulk_items is not None:
+            self._bulk_items.append(item)
+        else:
+            self._view.itemAdded.emit(item)
+    
+    @contextmanager
+    def bulk_add(self):
+        """Collect add_item() calls and add them to the canvas as one batch on exit."""
+        if self._bulk_items is not None:
+            yield  # Nested: the outermost block emits
+            return
+        self._bulk_items = []
+        try:
+            yield
+        finally:
+            items, self._bulk_items = self._bulk_items, None
+            if items:
+                self._view.itemsAdded.emit(items)
     
     def delete_items(self, items: List[Any]) -> None:
         """Delete items from the canvas."""
         self._main_window._remove_items(items)
     
     def refresh_scene(self) -> None:
-        """Force scene redraw."""
-        self._scene.update()
+        """Force scene redraw (coalesced to one update per event-loop pass)."""
+        if not self._update_timer.isActive():
+            self._update_timer.start()
     
     # ========================================================================
     # Undo/Redo
@@ -202,6 +289,10 @@ class PluginAPI:
         """End the current undo group."""
         self._undo_manager.end_group()
     
+    def batched_undo(self):
+        """Context manager that sends undo/redo UI updates once, on exit."""
+        return self._undo_manager.batched()
+    
     def create_image_edit_action(self, item, old_pixmap: QPixmap, 
                                   new_pixmap: QPixmap, description: str):
         """Create an undoable image edit action."""
@@ -212,13 +303,21 @@ class PluginAPI:
     # Plugin Settings
     # ========================================================================
     
+    def _settings_for(self, plugin_id: str) -> QSettings:
+        settings = self._group_settings.get(plugin_id)
+        if settings is None:
+            settings = QSettings("CanvasForge", "Plugins")
+            settings.beginGroup(plugin_id)
+            self._group_settings[plugin_id] = settings
+        return settings
+    
     def get_setting(self, plugin_id: str, key: str, default=None):
         """Get a plugin setting."""
-        return self._settings.value(f"{plugin_id}/{key}", default)
+        return self._settings_for(plugin_id).value(key, default)
     
     def set_setting(self, plugin_id: str, key: str, value) -> None:
         """Set a plugin setting."""
-        self._settings.setValue(f"{plugin_id}/{key}", value)
+        self._settings_for(plugin_id).setValue(key, value)
     
     # ========================================================================
     # UI Registration
@@ -228,96 +327,96 @@ class PluginAPI:
                                  icon_path: Optional[str] = None,
                                  shortcut: Optional[str] = None) -> QAction:
         """Register a toolbar action."""
-        action = QAction(text, self._main_window)
-        
         # Calculate canonical resource name for theming
         # e.g. "Crop Selection" -> "toolbar_icon_crop_selection"
         resource_name = f"toolbar_icon_{text.lower().replace(' ', '_')}"
-        
-        # Determine strict icon priority:
-        # 1. Active Theme (if not default)
-        # 2. Plugin's local icon (icon_path)
-        # 3. Global default / Fallback (via get_icon_resource)
-        
-        icon_set = False
-        
-        # 1. Check Theme
-        if hasattr(self._main_window, 'settings'):
-            theme = self._main_window.settings.value("appearance/icon_theme", "default")
-            if theme != "default":
-                # We need to construct the path to check existence
-                # Assuming assets structure is standard relative to main window or we use pathlib
-                base_dir = Path(self._main_window.default_save_dir).parent.parent / "dev" / "CanvasForge" / "assets" / "toolbar_icons"
-                # Fallback to standard relative path if the above hardcoded dev path is risky
-                # Better: use __file__ of main module? We don't have access to it directly here easily 
-                # but we can assume PluginManager is intantiated with knowledge or search.
-                # Actually, relying on main_window.get_icon_resource is safer if we can trust it.
-                # But get_icon_resource falls back to global default.
-                
-                # Let's try to query get_icon_resource but only accept if it matches the theme path?
-                # No, get_icon_resource returns a QIcon, hard to inspect.
-                
-                # Let's perform a manual check similar to MainWindow logic
-                # We can access MainWindow class path via the instance?
-                import sys
-                main_mod = sys.modules.get('__main__')
-                if main_mod and hasattr(main_mod, '__file__'):
-                    base_dir = Path(main_mod.__file__).parent / "assets" / "toolbar_icons"
-                    theme_dir = base_dir / theme
-                    
-                    if theme_dir.exists():
-                        # prioritized SVG
-                        if (theme_dir / f"{resource_name}.svg").exists():
-                            action.setIcon(QIcon(str(theme_dir / f"{resource_name}.svg")))
-                            icon_set = True
-                        elif (theme_dir / f"{resource_name}.png").exists():
-                            action.setIcon(QIcon(str(theme_dir / f"{resource_name}.png")))
-                            icon_set = True
-
-        # 2. Check Plugin Local
-        if not icon_set and icon_path and os.path.exists(icon_path):
-            action.setIcon(QIcon(icon_path))
-            icon_set = True
-            
-        # 3. Fallback to Global / Placeholder
-        if not icon_set and hasattr(self._main_window, 'get_icon_resource'):
-            action.setIcon(self._main_window.get_icon_resource(resource_name))
-
-        if shortcut:
-            action.setShortcut(shortcut)
-        action.triggered.connect(callback)
+        icon = self._resolve_toolbar_icon(resource_name, icon_path)
+        action = _make_action(text, self._main_window, callback, shortcut, icon)
         
         # Use the new plugin toolbar registration system
         action_id = f"plugin_{self._plugin_id}_{text.lower().replace(' ', '_')}"
         if hasattr(self._main_window, 'register_plugin_toolbar_action'):
             # Pass resource_name (e.g. "toolbar_icon_crop") so Preferences knows what file to save to
             self._main_window.register_plugin_toolbar_action(action_id, action, resource_name)
+            self._action_owners.append((action, None))
+            self._toolbar_action_ids.append(action_id)
         else:
             self._main_window.toolbar.addAction(action)
+            self._action_owners.append((action, self._main_window.toolbar))
+        self._toolbar_icon_sources.append((action, resource_name, icon_path))
         
-        self._registered_actions.append(action)
         return action
     
+    def refresh_toolbar_icons(self) -> None:
+        """Re-resolve this plugin's toolbar icons, e.g. after the icon theme changed."""
+        for action, resource_name, icon_path in self._toolbar_icon_sources:
+            icon = self._resolve_toolbar_icon(resource_name, icon_path)
+            if icon is not None:
+                action.setIcon(icon)
+    
+    def _resolve_toolbar_icon(self, resource_name: str, icon_path: Optional[str]) -> Optional[QIcon]:
+        """Pick a toolbar icon by strict priority.
+
+        1. Active Theme (if not default)
+        2. Plugin's local icon (icon_path)
+        3. Global default / Fallback (via get_icon_resource)
+        """
+        icon = None
+        
+        # 1. Check Theme
+        if hasattr(self._main_window, 'settings') and self._icon_base_dir is not None:
+            theme = self._main_window.settings.value("appearance/icon_theme", "default")
+            if theme != "default":
+                theme_dir = self._icon_base_dir / theme
+                theme_files = self._theme_icon_names(theme_dir)
+                # prioritized SVG
+                for ext in ('.svg', '.png'):
+                    if resource_name + ext in theme_files:
+                        icon = _cached_icon(str(theme_dir / f"{resource_name}{ext}"))
+                        break
+
+        # 2. Check Plugin Local
+        if icon is None and icon_path:
+            icon = _cached_icon(icon_path)
+            
+        # 3. Fallback to Global / Placeholder
+        if icon is None and hasattr(self._main_window, 'get_icon_resource'):
+            icon = self._main_window.get_icon_resource(resource_name)
+        return icon
+    
+    def _theme_icon_names(self, theme_dir: Path) -> frozenset:
+        """File names in a theme folder, re-listed only when the folder changes."""
+        try:
+            mtime = theme_dir.stat().st_mtime_ns
+        except OSError:
+            return frozenset()
+        cached = self._theme_listings.get(theme_dir)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, frozenset(os.listdir(theme_dir)))
+            self._theme_listings[theme_dir] = cached
+        return cached[1]
+    
     def register_menu_action(self, menu_name: str, text: str, callback: Callable,
                               shortcut: Optional[str] = None) -> QAction:
         """Register a menu action."""
         # Find or create the menu
         menu_bar = self._main_window.menuBar()
-        target_menu = None
-        for action in menu_bar.actions():
-            if action.text() == menu_name:
-                target_menu = action.menu()
-                break
+        target_menu = self._menu_index.get(menu_name)
+        if target_menu is None or sip.isdeleted(target_menu):
+            # Miss: menus may have been added since the last scan
+            self._menu_index = {
+                action.text(): action.menu()
+                for action in reversed(menu_bar.actions()) if action.menu()
+            }
+            target_menu = self._menu_index.get(menu_name)
         
         if not target_menu:
             target_menu = menu_bar.addMenu(menu_name)
+            self._menu_index[menu_name] = target_menu
         
-        action = QAction(text, self._main_window)
-        if shortcut:
-            action.setShortcut(shortcut)
-        action.triggered.connect(callback)
+        action = _make_action(text, self._main_window, callback, shortcut)
         target_menu.addAction(action)
-        self._registered_actions.append(action)
+        self._action_owners.append((action, target_menu))
         return action
     
     def show_status_message(self, message: str, timeout_ms: int = 4000) -> None:
@@ -342,15 +441,20 @@ class PluginAPI:
     
     def cleanup(self) -> None:
         """Remove all registered actions (called on plugin unload)."""
-        for action in self._registered_actions:
-            # Remove from toolbar
-            self._main_window.toolbar.removeAction(action)
-            # Remove from any menus
-            for menu_action in self._main_window.menuBar().actions():
-                menu = menu_action.menu()
-                if menu:
-                    menu.removeAction(action)
-        self._registered_actions.clear()
+        self._update_timer.stop()
+        for action, owner in self._action_owners:
+            if owner is not None:
+                owner.removeAction(action)
+        if self._toolbar_action_ids and hasattr(self._main_window, 'unregister_plugin_toolbar_actions'):
+            self._main_window.unregister_plugin_toolbar_actions(self._toolbar_action_ids)
+        # The actions are children of the main window, so drop their callback
+        # references now and delete them rather than let each reload add more
+        for action, _ in self._action_owners:
+            action.triggered.disconnect()
+            action.deleteLater()
+        self._action_owners.clear()
+        self._toolbar_action_ids.clear()
+        self._toolbar_icon_sources.clear()
         # Clear tool plugin if this was active
         self._main_window.set_active_plugin_tool(None)
 
@@ -371,6 +475,13 @@ class PluginManager(QObject):
         self._plugins: Dict[str, LoadedPlugin] = {}
         self._plugin_apis: Dict[str, PluginAPI] = {}
         self._settings = QSettings("CanvasForge", "Plugins")
+        # manifest.json path -> (st_mtime_ns, parsed manifest)
+        self._manifest_cache: Dict[Path, tuple] = {}
+        # plugin id -> (source mtime, module) kept from the last unload
+        self._retained_modules: Dict[str, tuple] = {}
+        # Resolved once for every plugin's theme icon lookups
+        self._icon_base_dir = self._find_icon_base_dir(main_window)
+        self._theme_listings: Dict[Path, tuple] = {}
         
         # Plugin directories
         self._user_plugin_dir = Path.home() / ".canvasforge" / "plugins"
@@ -380,6 +491,17 @@ class PluginManager(QObject):
         self._user_plugin_dir.mkdir(parents=True, exist_ok=True)
         self._builtin_plugin_dir.mkdir(parents=True, exist_ok=True)
     
+    @staticmethod
+    def _find_icon_base_dir(main_window) -> Optional[Path]:
+        """Locate the toolbar icon assets next to the running main module."""
+        base_dir = getattr(main_window, '_icon_base_dir', None)
+        if base_dir is not None:
+            return Path(base_dir)
+        main_mod = sys.modules.get('__main__')
+        if main_mod and hasattr(main_mod, '__file__'):
+            return Path(main_mod.__file__).parent / "assets" / "toolbar_icons"
+        return None
+    
     @property
     def user_plugin_dir(self) -> Path:
         return self._user_plugin_dir
@@ -390,28 +512,58 @@ class PluginManager(QObject):
     
     def discover_plugins(self) -> List[PluginManifest]:
         """Scan plugin directories for available plugins."""
-        manifests = []
+        # (manifest.json path, st_mtime_ns) in scan order
+        manifest_stats = []
         
         for plugin_dir in [self._builtin_plugin_dir, self._user_plugin_dir]:
-            if not plugin_dir.exists():
+            try:
+                entries = os.scandir(plugin_dir)
+            except OSError:
                 continue
-            
-            for item in plugin_dir.iterdir():
-                if item.is_dir():
-                    manifest_path = item / "manifest.json"
-                    if manifest_path.exists():
-                        try:
-                            with open(manifest_path, 'r') as f:
-                                data = json.load(f)
-                            manifest = PluginManifest.from_dict(data)
-                            manifests.append(manifest)
-                        except Exception as e:
-                            print(f"Error reading manifest from {item}: {e}")
+            # DirEntry.is_dir() reuses the type the directory read returned
+            with entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    manifest_path = os.path.join(entry.path, "manifest.json")
+                    try:
+                        mtime = os.stat(manifest_path).st_mtime_ns
+                    except OSError:
+                        continue
+                    manifest_stats.append((Path(manifest_path), mtime))
+        
+        if len(manifest_stats) < 2:
+            results = [self._read_manifest(*stat) for stat in manifest_stats]
+        else:
+            # Manifest reads are independent file IO; map() keeps scan order
+            with ThreadPoolExecutor(max_workers=min(8, len(manifest_stats))) as pool:
+                results = list(pool.map(lambda stat: self._read_manifest(*stat), manifest_stats))
+        
+        return [manifest for manifest in results if manifest is not None]
+    
+    def _read_manifest(self, manifest_path: Path,
+                       mtime: Optional[int] = None) -> Optional[PluginManifest]:
+        """Parse one manifest.json, returning None if it is unreadable.
         
-        return manifests
+        Parsed manifests are reused until the file's mtime changes; pass
+        `mtime` when the caller has already stat'ed the file.
+        """
+        try:
+            if mtime is None:
+                mtime = manifest_path.stat().st_mtime_ns
+            cached = self._manifest_cache.get(manifest_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            # json detects UTF-8 from bytes, skipping the text-mode decode layer
+            manifest = PluginManifest.from_dict(json.loads(manifest_path.read_bytes()))
+            self._manifest_cache[manifest_path] = (mtime, manifest)
+            return manifest
+        except Exception as e:
+            print(f"Error reading manifest from {manifest_path.parent}: {e}")
+            return None
     
-    def load_plugin(self, plugin_id: str) -> bool:
-        """Load a plugin by ID."""
+    def load_plugin(self, plugin_id: str, manifest: Optional[PluginManifest] = None) -> bool:
+        """Load a plugin by ID, reusing `manifest` if the caller already parsed it."""
         if plugin_id in self._plugins:
             return True  # Already loaded
         
@@ -427,10 +579,13 @@ class PluginManager(QObject):
             self.pluginError.emit(plugin_id, f"Plugin directory not found: {plugin_id}")
             return False
         
+        loaded = None
         try:
-            # Load manifest
-            with open(plugin_path / "manifest.json", 'r') as f:
-                manifest = PluginManifest.from_dict(json.load(f))
+            # Load manifest unless discover_plugins already handed it over
+            if manifest is None:
+                manifest = self._read_manifest(plugin_path / "manifest.json")
+            if manifest is None:
+                raise ValueError("manifest.json could not be read")
             
             # Check if disabled in settings
             enabled = self._settings.value(f"{plugin_id}/enabled", True, type=bool)
@@ -454,48 +609,41 @@ class PluginManager(QObject):
                 self.pluginError.emit(plugin_id, loaded.error)
                 return False
             
-            # Import the module
-            spec = importlib.util.spec_from_file_location(
-                f"canvasforge_plugin_{plugin_id}",
-                entry_file
-            )
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[spec.name] = module
-            spec.loader.exec_module(module)
-            
-            loaded.module = module
-            
             # Create API instance for this plugin
-            api = PluginAPI(self._main_window, self._undo_manager, plugin_id)
+            api = PluginAPI(self._main_window, self._undo_manager, plugin_id,
+                            self._icon_base_dir, self._theme_listings)
             self._plugin_apis[plugin_id] = api
             
-            # Instantiate plugin class if defined
-            if hasattr(module, 'Plugin'):
-                loaded.instance = module.Plugin(api)
-                
-                # Call on_load hook if defined
-                if hasattr(loaded.instance, 'on_load'):
-                    loaded.instance.on_load()
+            if manifest.lazy:
+                # Import on first use; manifest actions go through a trampoline
+                self._plugins[plugin_id] = loaded
+                def resolve(callback_name):
+                    return functools.partial(self._lazy_invoke, plugin_id, callback_name)
+            else:
+                self._materialize(loaded, api)
+                def resolve(callback_name):
+                    return getattr(loaded.instance, callback_name, None)
             
             # Register toolbar items from manifest
             for item in manifest.toolbar_items:
-                if hasattr(loaded.instance, item.get('callback', '')):
-                    callback = getattr(loaded.instance, item['callback'])
+                callback = resolve(item.get('callback', ''))
+                if callback is not None:
                     icon_path = None
                     if item.get('icon'):
                         # Try to find the icon file, supporting both png and svg
+                        plugin_dir_str = str(plugin_path)
                         base_icon_name = Path(item['icon']).stem
-                        potential_paths = [
-                            plugin_path / f"{base_icon_name}.svg",
-                            plugin_path / f"{base_icon_name}.png",
-                            plugin_path / item['icon']
-                        ]
-                        
-                        for p in potential_paths:
-                            if p.exists():
-                                icon_path = str(p)
+                        potential_names = (
+                            f"{base_icon_name}.svg",
+                            f"{base_icon_name}.png",
+                            item['icon'],
+                        )
+                        for name in potential_names:
+                            candidate = os.path.join(plugin_dir_str, name)
+                            if os.path.isfile(candidate):
+                                icon_path = candidate
                                 break
-                                
+                    
                     api.register_toolbar_action(
                         item.get('text', 'Action'),
                         callback,
@@ -505,9 +653,8 @@ class PluginManager(QObject):
             
             # Register menu items from manifest
             for item in manifest.menu_items:
-                callback_name = item.get('callback', '')
-                if hasattr(loaded.instance, callback_name):
-                    callback = getattr(loaded.instance, callback_name)
+                callback = resolve(item.get('callback', ''))
+                if callback is not None:
                     api.register_menu_action(
                         item.get('menu', 'Plugins'),
                         item.get('text', 'Action'),
@@ -521,13 +668,83 @@ class PluginManager(QObject):
             
         except Exception as e:
             error_msg = f"Failed to load plugin: {str(e)}"
+            # Undo whatever on_load or the manifest registration got through
+            api = self._plugin_apis.pop(plugin_id, None)
+            if api is not None:
+                api.cleanup()
+            sys.modules.pop(f"canvasforge_plugin_{plugin_id}", None)
+            if loaded is not None:
+                loaded.module = None
+                loaded.instance = None
+                loaded.error = error_msg
+                self._plugins[plugin_id] = loaded
             self.pluginError.emit(plugin_id, error_msg)
-            if plugin_id in self._plugins:
-                self._plugins[plugin_id].error = error_msg
             return False
     
-    def unload_plugin(self, plugin_id: str) -> bool:
-        """Unload a plugin."""
+    def _materialize(self, loaded: LoadedPlugin, api: PluginAPI) -> None:
+        """Import a plugin's entry point, instantiate it and run on_load."""
+        plugin_id = loaded.manifest.id
+        module_name = f"canvasforge_plugin_{plugin_id}"
+        source_mtime = self._source_mtime(loaded.path)
+        retained = self._retained_modules.pop(plugin_id, None)
+        if retained is not None and retained[0] == source_mtime:
+            # Unchanged since it was unloaded: skip re-executing the module
+            module = retained[1]
+            sys.modules[module_name] = module
+        else:
+            spec = importlib.util.spec_from_file_location(
+                module_name,
+                loaded.path / loaded.manifest.entry_point
+            )
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[spec.name] = module
+            spec.loader.exec_module(module)
+        
+        loaded.module = module
+        loaded.source_mtime = source_mtime
+        
+        # Instantiate plugin class if defined
+        if hasattr(module, 'Plugin'):
+            loaded.instance = module.Plugin(api)
+            
+            # Call on_load hook if defined
+            if hasattr(loaded.instance, 'on_load'):
+                loaded.instance.on_load()
+    
+    @staticmethod
+    def _source_mtime(plugin_path: Path) -> int:
+        """Newest modification time of the Python files anywhere in the plugin folder."""
+        return max((path.stat().st_mtime_ns for path in plugin_path.rglob("*.py")), default=0)
+    
+    def _lazy_invoke(self, plugin_id: str, callback_name: str, _checked: bool = False) -> None:
+        """Action trampoline for lazy plugins: import on first use, then dispatch."""
+        loaded = self._plugins.get(plugin_id)
+        api = self._plugin_apis.get(plugin_id)
+        if loaded is None or api is None:
+            return
+        if loaded.module is None:
+            try:
+                self._materialize(loaded, api)
+            except Exception as e:
+                # Roll back like load_plugin so the next trigger retries a
+                # clean import; the API stays since it owns the lazy actions
+                sys.modules.pop(f"canvasforge_plugin_{plugin_id}", None)
+                loaded.module = None
+                loaded.instance = None
+                loaded.error = f"Failed to load plugin: {str(e)}"
+                self.pluginError.emit(plugin_id, loaded.error)
+                return
+        callback = getattr(loaded.instance, callback_name, None)
+        if callback is None:
+            self.pluginError.emit(plugin_id, f"Plugin has no callback '{callback_name}'")
+            return
+        try:
+            callback()
+        except Exception as e:
+            self.pluginError.emit(plugin_id, f"Plugin callback '{callback_name}' failed: {str(e)}")
+    
+    def unload_plugin(self, plugin_id: str, retain_module: bool = False) -> bool:
+        """Unload a plugin; `retain_module` keeps its module for an immediate reload."""
         if plugin_id not in self._plugins:
             return False
         
@@ -543,10 +760,15 @@ class PluginManager(QObject):
                 self._plugin_apis[plugin_id].cleanup()
                 del self._plugin_apis[plugin_id]
             
-            # Remove from sys.modules
+            # Remove from sys.modules; a reload keeps the module object so an
+            # unchanged plugin is not re-executed, anything else releases it
             module_name = f"canvasforge_plugin_{plugin_id}"
             if module_name in sys.modules:
                 del sys.modules[module_name]
+            if retain_module and loaded.module is not None:
+                self._retained_modules[plugin_id] = (loaded.source_mtime, loaded.module)
+            else:
+                self._retained_modules.pop(plugin_id, None)
             
             del self._plugins[plugin_id]
             self.pluginUnloaded.emit(plugin_id)
@@ -558,7 +780,7 @@ class PluginManager(QObject):
     
     def reload_plugin(self, plugin_id: str) -> bool:
         """Reload a plugin (unload then load)."""
-        self.unload_plugin(plugin_id)
+        self.unload_plugin(plugin_id, retain_module=True)
         return self.load_plugin(plugin_id)
     
     def enable_plugin(self, plugin_id: str, enabled: bool) -> None:
@@ -573,6 +795,11 @@ class PluginManager(QObject):
             else:
                 self.unload_plugin(plugin_id)
     
+    def refresh_toolbar_icons(self) -> None:
+        """Re-resolve every loaded plugin's toolbar icons for the current theme."""
+        for api in self._plugin_apis.values():
+            api.refresh_toolbar_icons()
+    
     def get_plugin(self, plugin_id: str) -> Optional[LoadedPlugin]:
         """Get a loaded plugin by ID."""
         return self._plugins.get(plugin_id)
@@ -584,7 +811,7 @@ class PluginManager(QObject):
     def load_all_plugins(self) -> None:
         """Load all discovered plugins."""
         for manifest in self.discover_plugins():
-            self.load_plugin(manifest.id)
+            self.load_plugin(manifest.id, manifest)
     
     def get_plugin_api(self, plugin_id: str) -> Optional[PluginAPI]:
         """Get the API instance for a plugin."""
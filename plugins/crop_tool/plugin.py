@@ -14,34 +14,72 @@ Features:
 - Keyboard shortcuts: C to apply crop, Escape to cancel
 """
 
-from PyQt6.QtCore import Qt, QRectF, QPointF
-from PyQt6.QtWidgets import QGraphicsRectItem, QGraphicsItem
-from PyQt6.QtGui import QPen, QBrush, QColor, QPixmap, QCursor
+from PyQt6.QtCore import Qt, QRectF, QPointF, QTimer
+from PyQt6.QtWidgets import QGraphicsRectItem, QGraphicsItem, QGraphicsView
+from PyQt6.QtGui import QPen, QBrush, QColor, QPixmap, QCursor, QPainterPath
+
+from undo_manager import ItemEditAction, _decode_png, _encode_png
 
 
 class CropHandle:
-    """Represents a draggable edge or corner of the crop overlay."""
-    TOP = 0
-    RIGHT = 1
-    BOTTOM = 2
-    LEFT = 3
-    TOP_LEFT = 4
-    TOP_RIGHT = 5
-    BOTTOM_RIGHT = 6
-    BOTTOM_LEFT = 7
+    """Represents a draggable edge or corner of the crop overlay.
+    
+    Values are edge bit flags, so a corner is the OR of its two edges and
+    a drag tests each edge with a single AND. Plain ints rather than an
+    IntFlag, whose operators go through the enum machinery.
+    """
+    LEFT = 1
+    RIGHT = 2
+    TOP = 4
+    BOTTOM = 8
+    TOP_LEFT = TOP | LEFT
+    TOP_RIGHT = TOP | RIGHT
+    BOTTOM_RIGHT = BOTTOM | RIGHT
+    BOTTOM_LEFT = BOTTOM | LEFT
 
 
 class CropOverlay(QGraphicsRectItem):
     """Visual overlay showing the crop region with draggable edges."""
     
     HANDLE_SIZE = 12  # pixels for edge/corner hit detection
+    MOVE_INTERVAL_MS = 16  # coalesce drag updates to roughly one per frame
+    
+    # Cursor per handle, indexed by the CropHandle bit mask (0 = interior)
+    _CURSORS = (
+        Qt.CursorShape.SizeAllCursor,    # interior: move the whole thing
+        Qt.CursorShape.SizeHorCursor,    # LEFT
+        Qt.CursorShape.SizeHorCursor,    # RIGHT
+        None,
+        Qt.CursorShape.SizeVerCursor,    # TOP
+        Qt.CursorShape.SizeFDiagCursor,  # TOP_LEFT
+        Qt.CursorShape.SizeBDiagCursor,  # TOP_RIGHT
+        None,
+        Qt.CursorShape.SizeVerCursor,    # BOTTOM
+        Qt.CursorShape.SizeBDiagCursor,  # BOTTOM_LEFT
+        Qt.CursorShape.SizeFDiagCursor,  # BOTTOM_RIGHT
+    )
     
     def __init__(self, plugin):
         super().__init__()
         self.plugin = plugin
         self._dragging_handle = None
         self._drag_start_rect = None
+        self._drag_start_coords = None
         self._drag_start_pos = None
+        self._last_applied_rect = None
+        self._last_cursor_shape = None
+        
+        # Hit tests ask for these repeatedly; they only change with the rect
+        self._cached_bounding = None
+        self._cached_shape = None
+        
+        # Only the newest drag position per frame is applied; graphics items
+        # are not QObjects, so the timer is held here without a parent
+        self._pending_pos = None
+        self._move_timer = QTimer()
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(self.MOVE_INTERVAL_MS)
+        self._move_timer.timeout.connect(self._flush_move)
         
         # Visual style - dashed yellow border
         pen = QPen(QColor(255, 200, 0), 2, Qt.PenStyle.DashLine)
@@ -63,6 +101,20 @@ class CropOverlay(QGraphicsRectItem):
         """Set the crop rectangle in scene coordinates."""
         self.setPos(rect.topLeft())
         self.setRect(0, 0, rect.width(), rect.height())
+        self._cached_bounding = None
+        self._cached_shape = None
+    
+    def boundingRect(self) -> QRectF:
+        if self._cached_bounding is None:
+            self._cached_bounding = super().boundingRect()
+        return self._cached_bounding
+    
+    def shape(self) -> QPainterPath:
+        if self._cached_shape is None:
+            path = QPainterPath()
+            path.addRect(self.boundingRect())
+            self._cached_shape = path
+        return self._cached_shape
     
     def scene_crop_rect(self) -> QRectF:
         """Get the crop rectangle in scene coordinates."""
@@ -81,50 +133,31 @@ class CropOverlay(QGraphicsRectItem):
         on_top = y < h
         on_bottom = y > rect.height() - h
         
-        # Corners first (they take priority)
-        if on_top and on_left:
-            return CropHandle.TOP_LEFT
-        if on_top and on_right:
-            return CropHandle.TOP_RIGHT
-        if on_bottom and on_right:
-            return CropHandle.BOTTOM_RIGHT
-        if on_bottom and on_left:
-            return CropHandle.BOTTOM_LEFT
-        
-        # Then edges
-        if on_top:
-            return CropHandle.TOP
-        if on_right:
-            return CropHandle.RIGHT
-        if on_bottom:
-            return CropHandle.BOTTOM
-        if on_left:
-            return CropHandle.LEFT
-        
-        return None  # Inside, not on an edge
+        # On a rect narrower than two handles both opposite edges can be
+        # hit: top beats bottom, and left only beats right along the top
+        vert = CropHandle.TOP if on_top else (CropHandle.BOTTOM if on_bottom else 0)
+        if on_left and on_right:
+            horiz = CropHandle.LEFT if vert == CropHandle.TOP else CropHandle.RIGHT
+        else:
+            horiz = CropHandle.LEFT if on_left else (CropHandle.RIGHT if on_right else 0)
+        
+        return (vert | horiz) or None  # None: inside, not on an edge
     
     def _cursor_for_handle(self, handle: int) -> Qt.CursorShape:
         """Get the appropriate cursor for a handle."""
-        if handle in (CropHandle.TOP, CropHandle.BOTTOM):
-            return Qt.CursorShape.SizeVerCursor
-        if handle in (CropHandle.LEFT, CropHandle.RIGHT):
-            return Qt.CursorShape.SizeHorCursor
-        if handle in (CropHandle.TOP_LEFT, CropHandle.BOTTOM_RIGHT):
-            return Qt.CursorShape.SizeFDiagCursor
-        if handle in (CropHandle.TOP_RIGHT, CropHandle.BOTTOM_LEFT):
-            return Qt.CursorShape.SizeBDiagCursor
-        return Qt.CursorShape.SizeAllCursor  # For moving the whole thing
+        return self._CURSORS[handle or 0]
     
     def hoverMoveEvent(self, event):
         """Update cursor based on which edge/corner we're hovering."""
-        handle = self._get_handle_at(event.pos())
-        if handle is not None:
-            self.setCursor(self._cursor_for_handle(handle))
-        else:
-            self.setCursor(Qt.CursorShape.SizeAllCursor)  # Move cursor inside
+        shape = self._cursor_for_handle(self._get_handle_at(event.pos()))
+        # Only go through the platform cursor update when the shape changes
+        if shape != self._last_cursor_shape:
+            self.setCursor(shape)
+            self._last_cursor_shape = shape
         super().hoverMoveEvent(event)
     
     def hoverLeaveEvent(self, event):
+        self._last_cursor_shape = None
         self.unsetCursor()
         super().hoverLeaveEvent(event)
     
@@ -138,53 +171,89 @@ class CropOverlay(QGraphicsRectItem):
         if event.button() == Qt.MouseButton.LeftButton:
             self._dragging_handle = self._get_handle_at(event.pos())
             self._drag_start_rect = self.scene_crop_rect()
+            # Edge coordinates as plain floats for the per-move arithmetic
+            self._drag_start_coords = self._drag_start_rect.getCoords()
             self._drag_start_pos = event.scenePos()
+            self._last_applied_rect = self._drag_start_rect
+            self.plugin._cache_target_bounds()
             event.accept()
     
     def mouseMoveEvent(self, event):
         if self._drag_start_rect is None:
             return
         
-        delta = event.scenePos() - self._drag_start_pos
-        rect = QRectF(self._drag_start_rect)
+        # Sub-pixel jitter around the press point changes nothing
+        scene_pos = event.scenePos()
+        if (self._last_applied_rect == self._drag_start_rect
+                and (scene_pos - self._drag_start_pos).manhattanLength() < 1.0):
+            event.accept()
+            return
+        
+        self._pending_pos = scene_pos
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+        event.accept()
+    
+    def _flush_move(self):
+        """Apply the latest queued drag position, if any."""
+        self._move_timer.stop()
+        scene_pos = self._pending_pos
+        self._pending_pos = None
+        if scene_pos is None or self._drag_start_rect is None:
+            return
+        
+        dx = scene_pos.x() - self._drag_start_pos.x()
+        dy = scene_pos.y() - self._drag_start_pos.y()
+        left, top, right, bottom = self._drag_start_coords
         
         handle = self._dragging_handle
         
         if handle is None:
             # Move the entire overlay
-            rect.translate(delta)
+            left += dx
+            right += dx
+            top += dy
+            bottom += dy
         else:
-            # Resize based on which handle is being dragged
-            if handle in (CropHandle.LEFT, CropHandle.TOP_LEFT, CropHandle.BOTTOM_LEFT):
-                rect.setLeft(rect.left() + delta.x())
-            if handle in (CropHandle.RIGHT, CropHandle.TOP_RIGHT, CropHandle.BOTTOM_RIGHT):
-                rect.setRight(rect.right() + delta.x())
-            if handle in (CropHandle.TOP, CropHandle.TOP_LEFT, CropHandle.TOP_RIGHT):
-                rect.setTop(rect.top() + delta.y())
-            if handle in (CropHandle.BOTTOM, CropHandle.BOTTOM_LEFT, CropHandle.BOTTOM_RIGHT):
-                rect.setBottom(rect.bottom() + delta.y())
+            # Resize the edges that make up the dragged handle
+            if handle & CropHandle.LEFT:
+                left += dx
+            if handle & CropHandle.RIGHT:
+                right += dx
+            if handle & CropHandle.TOP:
+                top += dy
+            if handle & CropHandle.BOTTOM:
+                bottom += dy
         
         # Normalize and enforce minimum size
-        rect = rect.normalized()
-        if rect.width() < 10:
-            rect.setWidth(10)
-        if rect.height() < 10:
-            rect.setHeight(10)
+        if left > right:
+            left, right = right, left
+        if top > bottom:
+            top, bottom = bottom, top
+        rect = QRectF(left, top, max(right - left, 10), max(bottom - top, 10))
         
         # Constrain to target image bounds if we have one
-        if self.plugin._target_item:
-            img_rect = self.plugin._target_item.sceneBoundingRect()
+        img_rect = self.plugin._target_bounds()
+        if img_rect is not None and not img_rect.contains(rect):
             rect = rect.intersected(img_rect)
             if rect.isEmpty():
                 rect = QRectF(img_rect.topLeft(), QPointF(img_rect.left() + 10, img_rect.top() + 10))
         
+        # Skip the geometry change when the rect did not change
+        if rect == self._last_applied_rect:
+            return
+        self._last_applied_rect = rect
         self.set_crop_rect(rect)
-        event.accept()
     
     def mouseReleaseEvent(self, event):
+        # Land the final drag position before the gesture ends
+        self._flush_move()
         self._dragging_handle = None
         self._drag_start_rect = None
+        self._drag_start_coords = None
         self._drag_start_pos = None
+        self._last_applied_rect = None
+        self.plugin._target_bounds_cache = None
         event.accept()
 
 
@@ -195,9 +264,20 @@ class Plugin:
         self.api = api
         self._crop_overlay = None
         self._target_item = None
+        # The target cannot move during a crop drag, so its scene rect is
+        # taken once per gesture instead of on every mouse move
+        self._target_bounds_cache = None
         self._crop_mode_active = False
         self._drawing_crop = False
         self._draw_start_pos = None
+        self._saved_vp_mode = None
+        
+        # Draw-drags apply only the newest mouse position per frame
+        self._pending_pos = None
+        self._move_timer = QTimer()
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(CropOverlay.MOVE_INTERVAL_MS)
+        self._move_timer.timeout.connect(self._flush_view_move)
         
         # Store original view event handlers
         self._original_mouse_press = None
@@ -225,6 +305,7 @@ class Plugin:
         # Get the view and change cursor
         view = self.api._view
         view.setCursor(Qt.CursorShape.CrossCursor)
+        self._scope_viewport_updates(view)
         
         self.api.show_status_message(
             "Crop Mode: Click on an image, or drag to draw crop region. "
@@ -256,19 +337,36 @@ class Plugin:
         self._target_item = target
         
         # Create overlay covering the entire image
-        img_rect = target.sceneBoundingRect()
+        img_rect = self._cache_target_bounds()
         self._crop_overlay = CropOverlay(self)
         self.api._scene.addItem(self._crop_overlay)
         self._crop_overlay.set_crop_rect(img_rect)
         
         view = self.api._view
         view.setCursor(Qt.CursorShape.CrossCursor)
+        self._scope_viewport_updates(view)
         
         self.api.show_status_message(
             "Drag edges to adjust crop region. Press C or right-click to crop.",
             4000
         )
     
+    def _cache_target_bounds(self):
+        """Snapshot the target's scene rect at the start of a gesture."""
+        if self._target_item is None:
+            self._target_bounds_cache = None
+        else:
+            self._target_bounds_cache = self._target_item.sceneBoundingRect()
+        return self._target_bounds_cache
+    
+    def _target_bounds(self):
+        """Scene rect of the crop target, or None when there is no target."""
+        if self._target_item is None:
+            return None
+        if self._target_bounds_cache is None:
+            return self._cache_target_bounds()
+        return self._target_bounds_cache
+    
     def deactivate_crop_mode(self):
         """Deactivate crop mode and clean up."""
         if not self._crop_mode_active:
@@ -277,22 +375,42 @@ class Plugin:
         self._crop_mode_active = False
         self._drawing_crop = False
         self._draw_start_pos = None
+        self._move_timer.stop()
+        self._pending_pos = None
         
         # Remove overlay
         if self._crop_overlay:
+            self._crop_overlay._move_timer.stop()
             scene = self._crop_overlay.scene()
             if scene:
                 scene.removeItem(self._crop_overlay)
             self._crop_overlay = None
         
         self._target_item = None
+        self._target_bounds_cache = None
         
         # Clear ourselves as the active tool
         self.api.clear_active_tool_plugin()
         
-        # Restore view cursor
+        # Restore view cursor and update mode
         view = self.api._view
         view.unsetCursor()
+        if self._saved_vp_mode is not None:
+            view.setViewportUpdateMode(self._saved_vp_mode)
+            self._saved_vp_mode = None
+    
+    def _scope_viewport_updates(self, view):
+        """Repaint only the dirty bounding rect while cropping.
+        
+        The canvas repaints the full viewport for its selection handles; in
+        crop mode the overlay is the only thing that changes. A GPU viewport
+        (QOpenGLWidget) cannot repaint partially, so it keeps its full updates.
+        """
+        if view.viewport().inherits("QOpenGLWidget"):
+            return
+        if self._saved_vp_mode is None:
+            self._saved_vp_mode = view.viewportUpdateMode()
+            view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate)
     
     def _on_view_mouse_press(self, event):
         """Handle mouse press in crop mode."""
@@ -301,32 +419,33 @@ class Plugin:
         
         scene_pos = self.api._view.mapToScene(event.pos())
         
-        # Check if clicking on a raster item
-        item = self.api._scene.itemAt(scene_pos, self.api._view.transform())
+        # One point query, topmost first, stands in for itemAt plus a second
+        # scan; matching on shape lets clicks fall through transparent pixels
+        items = self.api._scene.items(
+            scene_pos,
+            Qt.ItemSelectionMode.IntersectsItemShape,
+            Qt.SortOrder.DescendingOrder,
+        )
         
         # Skip if clicking on existing overlay
-        if item == self._crop_overlay:
+        if items and items[0] is self._crop_overlay:
             return False
         
         # Find raster item under click
-        raster_item = None
-        if item and self.api.is_raster_item(item):
-            raster_item = item
-        else:
-            # Check items at this position
-            items = self.api._scene.items(scene_pos)
-            for i in items:
-                if i != self._crop_overlay and self.api.is_raster_item(i):
-                    raster_item = i
-                    break
+        raster_item = next(
+            (i for i in items if i is not self._crop_overlay and self.api.is_raster_item(i)),
+            None,
+        )
         
         if raster_item:
             self._target_item = raster_item
+            self._cache_target_bounds()
             self._drawing_crop = True
             self._draw_start_pos = scene_pos
             
             # Create or reset overlay
             if self._crop_overlay:
+                self._crop_overlay._move_timer.stop()
                 self._crop_overlay.scene().removeItem(self._crop_overlay)
             
             self._crop_overlay = CropOverlay(self)
@@ -342,26 +461,36 @@ class Plugin:
         if not self._drawing_crop or not self._crop_overlay:
             return False
         
-        scene_pos = self.api._view.mapToScene(event.pos())
+        self._pending_pos = self.api._view.mapToScene(event.pos())
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+        return True
+    
+    def _flush_view_move(self):
+        """Apply the latest queued draw position, if any."""
+        self._move_timer.stop()
+        scene_pos = self._pending_pos
+        self._pending_pos = None
+        if scene_pos is None or not self._drawing_crop or not self._crop_overlay:
+            return
         
         # Create rect from start to current
         rect = QRectF(self._draw_start_pos, scene_pos).normalized()
         
         # Constrain to target image
-        if self._target_item:
-            img_rect = self._target_item.sceneBoundingRect()
+        img_rect = self._target_bounds()
+        if img_rect is not None and not img_rect.contains(rect):
             rect = rect.intersected(img_rect)
         
         if not rect.isEmpty():
             self._crop_overlay.set_crop_rect(rect)
-        
-        return True
     
     def _on_view_mouse_release(self, event):
         """Handle mouse release in crop mode."""
         if not self._drawing_crop:
             return False
         
+        self._flush_view_move()
         self._drawing_crop = False
         self._draw_start_pos = None
         
@@ -370,9 +499,10 @@ class Plugin:
             rect = self._crop_overlay.scene_crop_rect()
             if rect.width() < 10 or rect.height() < 10:
                 # Too small, select full image
-                if self._target_item:
-                    img_rect = self._target_item.sceneBoundingRect()
+                img_rect = self._target_bounds()
+                if img_rect is not None:
                     self._crop_overlay.set_crop_rect(img_rect)
+        self._target_bounds_cache = None
         
         self.api.show_status_message(
             "Drag edges to adjust crop region. Press C or right-click to crop.",
@@ -459,9 +589,9 @@ class Plugin:
             self.deactivate_crop_mode()
             return
         
-        # Perform the crop
-        cropped_image = old_pixmap.toImage().copy(local_rect.toRect())
-        new_pixmap = QPixmap.fromImage(cropped_image)
+        # Perform the crop on the pixmap itself; only the cropped region is
+        # copied, and the item re-encodes its bytes lazily
+        new_pixmap = old_pixmap.copy(local_rect.toRect())
         
         # Calculate new position (crop rect's top-left in scene coords)
         old_pos = self._target_item.pos()
@@ -492,38 +622,73 @@ class Plugin:
         )
 
 
-class CropAction:
-    """Undoable crop action."""
+class CropAction(ItemEditAction):
+    """Undoable crop action.
+    
+    The uncropped pixmap is held by reference and, once the action is deep
+    in the undo history, PNG-compressed until an undo needs it again. The
+    item itself is held weakly so deleting it frees it and its pixmaps.
+    """
+    
+    serializable = True
     
     def __init__(self, item, old_pixmap: QPixmap, new_pixmap: QPixmap,
                  old_pos: QPointF, new_pos: QPointF):
-        self.description = "Crop Image"
-        self.item = item
+        super().__init__("Crop Image", item)
         self.old_pixmap = old_pixmap
         self.new_pixmap = new_pixmap
         self.old_pos = old_pos
         self.new_pos = new_pos
+        self._old_png = None
+    
+    def _release(self):
+        self.old_pixmap = self.new_pixmap = None
+        self._old_png = None
+    
+    def compact(self):
+        """Swap the uncropped pixmap for PNG bytes."""
+        if self.item is None:
+            self._release()
+            return
+        if self._old_png is not None or self.old_pixmap is None:
+            return
+        self._old_png = _encode_png(self.old_pixmap)
+        self.old_pixmap = None
+    
+    def _restore(self):
+        if self._old_png is not None:
+            self.old_pixmap = _decode_png(self._old_png)
+            self._old_png = None
     
     def execute(self):
         """Apply the crop."""
-        self.item.setPixmap(self.new_pixmap)
-        self.item.setPos(self.new_pos)
-        if hasattr(self.item, 'updateImageBytes'):
-            self.item.updateImageBytes()
+        item = self.item
+        if item is None:
+            self._release()
+            return
+        item.setPixmap(self.new_pixmap)
+        item.setPos(self.new_pos)
+        if hasattr(item, 'updateImageBytes'):
+            item.updateImageBytes()
         # Update transform origin for the new size
-        self.item.setTransformOriginPoint(
+        item.setTransformOriginPoint(
             self.new_pixmap.width() / 2,
             self.new_pixmap.height() / 2
         )
     
     def undo(self):
         """Restore original image."""
-        self.item.setPixmap(self.old_pixmap)
-        self.item.setPos(self.old_pos)
-        if hasattr(self.item, 'updateImageBytes'):
-            self.item.updateImageBytes()
+        item = self.item
+        if item is None:
+            self._release()
+            return
+        self._restore()
+        item.setPixmap(self.old_pixmap)
+        item.setPos(self.old_pos)
+        if hasattr(item, 'updateImageBytes'):
+            item.updateImageBytes()
         # Restore transform origin
-        self.item.setTransformOriginPoint(
+        item.setTransformOriginPoint(
             self.old_pixmap.width() / 2,
             self.old_pixmap.height() / 2
         )
@@ -6,18 +6,47 @@ across the entire application for every image edit.
 """
 
 import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
 from abc import ABC, abstractmethod
-from typing import Any, Optional, List, Callable
+from typing import Any, Deque, Optional, List, Callable
 from PyQt6.QtGui import QPixmap, QTransform
-from PyQt6.QtCore import QPointF, pyqtSignal, QObject
+from PyQt6.QtCore import QPointF, pyqtSignal, QObject, QByteArray, QBuffer, QIODevice
+from PyQt6 import sip
+
+
+def _encode_png(pixmap: QPixmap) -> QByteArray:
+    """PNG-encode a pixmap into an in-memory blob."""
+    data = QByteArray()
+    buf = QBuffer(data)
+    buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    pixmap.save(buf, "PNG")
+    buf.close()
+    return data
+
+
+def _decode_png(data: QByteArray) -> QPixmap:
+    pixmap = QPixmap()
+    pixmap.loadFromData(data, "PNG")
+    return pixmap
 
 
 class UndoableAction(ABC):
     """Base class for all undoable actions."""
     
+    # Follow-up edits to the same item within this many nanoseconds are
+    # folded into one undo step by actions that implement merge_with()
+    MERGE_WINDOW_NS = 400_000_000
+    
+    # Actions that set this provide compact(), which may trade held pixmaps
+    # for compressed bytes once they sit deep in the undo history
+    serializable = False
+    
     def __init__(self, description: str):
         self.description = description
-        self.timestamp = time.time()
+        # Monotonic, so merge windows are unaffected by wall-clock changes
+        self.timestamp = time.monotonic_ns()
     
     @abstractmethod
     def execute(self) -> None:
@@ -30,6 +59,27 @@ class UndoableAction(ABC):
         pass
 
 
+class ItemEditAction(UndoableAction):
+    """Base for actions that edit an item without owning it.
+    
+    The item is held weakly: an item deleted outside the undo history can
+    be freed, and the action then does nothing. Items removed through
+    RemoveItemAction stay alive because that action owns them.
+    """
+    
+    def __init__(self, description: str, item):
+        super().__init__(description)
+        self._item_ref = weakref.ref(item)
+    
+    @property
+    def item(self):
+        """The edited item, or None once it has been deleted."""
+        item = self._item_ref()
+        if item is None or sip.isdeleted(item):
+            return None
+        return item
+
+
 class ActionGroup(UndoableAction):
     """Group of actions that undo/redo together."""
     
@@ -47,6 +97,15 @@ class ActionGroup(UndoableAction):
     def undo(self) -> None:
         for action in reversed(self.actions):
             action.undo()
+    
+    @property
+    def serializable(self) -> bool:
+        return any(getattr(action, 'serializable', False) for action in self.actions)
+    
+    def compact(self) -> None:
+        for action in self.actions:
+            if getattr(action, 'serializable', False):
+                action.compact()
 
 
 class UndoManager(QObject):
@@ -57,12 +116,22 @@ class UndoManager(QObject):
     redoAvailableChanged = pyqtSignal(bool)
     undoDescriptionChanged = pyqtSignal(str)
     redoDescriptionChanged = pyqtSignal(str)
+    stackChanged = pyqtSignal()
     
-    def __init__(self, max_history: int = 100):
+    def __init__(self, max_history: int = 100, serialize_depth: int = 10):
         super().__init__()
-        self._undo_stack: List[UndoableAction] = []
-        self._redo_stack: List[UndoableAction] = []
+        # A bounded deque evicts the oldest action in O(1) once the history
+        # is full
+        self._undo_stack: Deque[UndoableAction] = deque(maxlen=max_history)
+        self._redo_stack: Deque[UndoableAction] = deque()
         self._max_history = max_history
+        # Image actions further than this from the top of the undo stack
+        # keep their pixmaps PNG-compressed until they are undone
+        self._serialize_depth = serialize_depth
+        # Inside batched() state signals are held back and sent once on exit
+        self._batch_depth = 0
+        self._state_dirty = False
+        self._last_state = None
         self._group_stack: List[ActionGroup] = []
     
     def execute(self, action: UndoableAction) -> None:
@@ -72,20 +141,24 @@ class UndoManager(QObject):
         # If we're in a group, add to group instead
         if self._group_stack:
             self._group_stack[-1].add(action)
+        elif self._merge_into_last(action):
+            self._emit_state_changed()
         else:
             self._undo_stack.append(action)
             self._redo_stack.clear()
-            self._trim_history()
+            self._serialize_if_old()
             self._emit_state_changed()
     
     def push(self, action: UndoableAction) -> None:
         """Add an already-executed action to undo stack."""
         if self._group_stack:
             self._group_stack[-1].add(action)
+        elif self._merge_into_last(action):
+            self._emit_state_changed()
         else:
             self._undo_stack.append(action)
             self._redo_stack.clear()
-            self._trim_history()
+            self._serialize_if_old()
             self._emit_state_changed()
     
     def undo(self) -> bool:
@@ -105,9 +178,33 @@ class UndoManager(QObject):
         action = self._redo_stack.pop()
         action.execute()
         self._undo_stack.append(action)
+        self._serialize_if_old()
         self._emit_state_changed()
         return True
     
+    def undo_many(self, count: int) -> int:
+        """Undo up to count actions with one UI update. Returns how many ran."""
+        actions = [self._undo_stack.pop() for _ in range(min(count, len(self._undo_stack)))]
+        with self.batched():
+            for i, action in enumerate(actions):
+                if not _superseded(action, actions[i + 1:i + 2]):
+                    action.undo()
+                self._redo_stack.append(action)
+            self._emit_state_changed()
+        return len(actions)
+    
+    def redo_many(self, count: int) -> int:
+        """Redo up to count actions with one UI update. Returns how many ran."""
+        actions = [self._redo_stack.pop() for _ in range(min(count, len(self._redo_stack)))]
+        with self.batched():
+            for i, action in enumerate(actions):
+                if not _superseded(action, actions[i + 1:i + 2]):
+                    action.execute()
+                self._undo_stack.append(action)
+                self._serialize_if_old()
+            self._emit_state_changed()
+        return len(actions)
+    
     def begin_group(self, name: str) -> None:
         """Begin a compound action group."""
         self._group_stack.append(ActionGroup(name))
@@ -119,7 +216,18 @@ class UndoManager(QObject):
             if group.actions:
                 self._undo_stack.append(group)
                 self._redo_stack.clear()
-                self._trim_history()
+                self._serialize_if_old()
+                self._emit_state_changed()
+    
+    @contextmanager
+    def batched(self):
+        """Hold back undo/redo state signals until the outermost block exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._state_dirty:
                 self._emit_state_changed()
     
     def can_undo(self) -> bool:
@@ -143,17 +251,55 @@ class UndoManager(QObject):
         self._group_stack.clear()
         self._emit_state_changed()
     
-    def _trim_history(self) -> None:
-        """Remove oldest actions if over limit."""
-        while len(self._undo_stack) > self._max_history:
-            self._undo_stack.pop(0)
+    def _merge_into_last(self, action: UndoableAction) -> bool:
+        """Fold action into the top of the undo stack if that one accepts it."""
+        if not self._undo_stack or self._redo_stack:
+            return False
+        merge_with = getattr(self._undo_stack[-1], 'merge_with', None)
+        return merge_with is not None and merge_with(action)
+    
+    def _serialize_if_old(self) -> None:
+        """Compact the action that has just slipped past the serialize depth."""
+        idx = len(self._undo_stack) - 1 - self._serialize_depth
+        if idx < 0:
+            return
+        action = self._undo_stack[idx]
+        if getattr(action, 'serializable', False):
+            action.compact()
     
     def _emit_state_changed(self) -> None:
-        """Emit signals for UI updates."""
-        self.undoAvailableChanged.emit(self.can_undo())
-        self.redoAvailableChanged.emit(self.can_redo())
-        self.undoDescriptionChanged.emit(self.undo_description())
-        self.redoDescriptionChanged.emit(self.redo_description())
+        """Emit signals for UI updates; the per-value ones skip unchanged values."""
+        if self._batch_depth:
+            self._state_dirty = True
+            return
+        self._state_dirty = False
+        self.stackChanged.emit()
+        state = (self.can_undo(), self.can_redo(),
+                 self.undo_description(), self.redo_description())
+        last = self._last_state or (None, None, None, None)
+        self._last_state = state
+        if state[0] != last[0]:
+            self.undoAvailableChanged.emit(state[0])
+        if state[1] != last[1]:
+            self.redoAvailableChanged.emit(state[1])
+        if state[2] != last[2]:
+            self.undoDescriptionChanged.emit(state[2])
+        if state[3] != last[3]:
+            self.redoDescriptionChanged.emit(state[3])
+
+
+def _superseded(action: UndoableAction, following: List[UndoableAction]) -> bool:
+    """True when the next action replayed sets the same absolute state.
+    
+    Moves and transforms write absolute values, so in a run of them on one
+    item only the last one applied is visible.
+    """
+    if not following or type(following[0]) is not type(action):
+        return False
+    if not isinstance(action, (MoveItemAction, TransformItemAction)):
+        return False
+    item = action.item
+    return item is not None and following[0].item is item
 
 
 # ============================================================================
@@ -204,61 +350,120 @@ class RemoveItemAction(UndoableAction):
             self.item.setZValue(self._z_value)
 
 
-class MoveItemAction(UndoableAction):
+class MoveItemAction(ItemEditAction):
     """Undo/redo item movement."""
     
     def __init__(self, item, old_pos: QPointF, new_pos: QPointF):
-        super().__init__("Move")
-        self.item = item
+        super().__init__("Move", item)
         self.old_pos = old_pos
         self.new_pos = new_pos
     
+    def merge_with(self, other: UndoableAction) -> bool:
+        """Absorb a follow-up move of the same item; keeps the first old_pos."""
+        if (type(other) is not MoveItemAction or other.item is not self.item
+                or other.timestamp - self.timestamp >= self.MERGE_WINDOW_NS):
+            return False
+        self.new_pos = other.new_pos
+        self.timestamp = other.timestamp
+        return True
+    
     def execute(self) -> None:
-        self.item.setPos(self.new_pos)
+        item = self.item
+        if item is not None:
+            item.setPos(self.new_pos)
     
     def undo(self) -> None:
-        self.item.setPos(self.old_pos)
+        item = self.item
+        if item is not None:
+            item.setPos(self.old_pos)
 
 
-class TransformItemAction(UndoableAction):
+class TransformItemAction(ItemEditAction):
     """Undo/redo item transformations (rotation, scale)."""
     
     def __init__(self, item, old_rotation: float, old_scale: float,
                  new_rotation: float, new_scale: float, description: str = "Transform"):
-        super().__init__(description)
-        self.item = item
+        super().__init__(description, item)
         self.old_rotation = old_rotation
         self.old_scale = old_scale
         self.new_rotation = new_rotation
         self.new_scale = new_scale
     
+    def merge_with(self, other: UndoableAction) -> bool:
+        """Absorb a follow-up transform of the same item; keeps the first old values."""
+        if (type(other) is not TransformItemAction or other.item is not self.item
+                or other.timestamp - self.timestamp >= self.MERGE_WINDOW_NS):
+            return False
+        self.new_rotation = other.new_rotation
+        self.new_scale = other.new_scale
+        self.timestamp = other.timestamp
+        return True
+    
     def execute(self) -> None:
-        self.item.setRotation(self.new_rotation)
-        self.item.setScale(self.new_scale)
+        item = self.item
+        if item is not None:
+            item.setRotation(self.new_rotation)
+            item.setScale(self.new_scale)
     
     def undo(self) -> None:
-        self.item.setRotation(self.old_rotation)
-        self.item.setScale(self.old_scale)
+        item = self.item
+        if item is not None:
+            item.setRotation(self.old_rotation)
+            item.setScale(self.old_scale)
 
 
-class ImageEditAction(UndoableAction):
-    """Undo/redo image pixel edits (crop, filter, etc.)."""
+class ImageEditAction(ItemEditAction):
+    """Undo/redo image pixel edits (crop, filter, etc.).
+    
+    Pixmaps are held by reference; QPixmap is implicitly shared, so callers
+    should pass the item's own pixmap rather than a copy() of it.
+    """
+    
+    serializable = True
     
     def __init__(self, item, old_pixmap: QPixmap, new_pixmap: QPixmap, description: str):
-        super().__init__(description)
-        self.item = item
+        super().__init__(description, item)
         self.old_pixmap = old_pixmap
         self.new_pixmap = new_pixmap
+        self._old_png: Optional[QByteArray] = None
+    
+    def compact(self) -> None:
+        """Swap the pre-edit pixmap for PNG bytes until it is needed again."""
+        if self.item is None:
+            self._release()
+            return
+        if self._old_png is None and self.old_pixmap is not None:
+            self._old_png = _encode_png(self.old_pixmap)
+            self.old_pixmap = None
+    
+    def _restore(self) -> None:
+        if self._old_png is not None:
+            self.old_pixmap = _decode_png(self._old_png)
+            self._old_png = None
+    
+    def _release(self) -> None:
+        """Drop the pixmaps once the item is gone; nothing can apply them."""
+        self.old_pixmap = self.new_pixmap = None
+        self._old_png = None
     
     def execute(self) -> None:
-        self.item.setPixmap(self.new_pixmap)
-        if hasattr(self.item, 'updateImageBytes'):
-            self.item.updateImageBytes()
+        item = self.item
+        if item is None:
+            self._release()
+            return
+        item.setPixmap(self.new_pixmap)
+        if hasattr(item, 'updateImageBytes'):
+            item.updateImageBytes()
     
     def undo(self) -> None:
-        self.item.setPixmap(self.old_pixmap)
-        if hasattr(self.item, 'updateImageBytes'):
-            self.item.updateImageBytes()
+        item = self.item
+        if item is None:
+            self._release()
+            return
+        self._restore()
+        item.setPixmap(self.old_pixmap)
+        if hasattr(item, 'updateImageBytes'):
+            item.updateImageBytes()
 
 
 class PropertyChangeAction(UndoableAction):